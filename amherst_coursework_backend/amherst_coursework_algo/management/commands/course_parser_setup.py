@@ -26,8 +26,6 @@ import json
 import logging
 import shutil
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Global semester variable - can be modified as needed
@@ -84,6 +82,9 @@ class Command(BaseCommand):
                 }
             ]
         """
+        # Configure logging
+        logging.basicConfig(level=logging.INFO)
+
         try:
 
             # Read the base JSON file
@@ -35,7 +35,7 @@ Example Output Format::
     }
 
 Dependencies:
-    - BeautifulSoup4 for HTML parsing
+    - selectolax for HTML parsing
     - Requests for HTTP requests
     - Django for command infrastructure
 """
@@ -48,10 +48,10 @@ import logging
 from amherst_coursework_algo.parse_course_catalogue.parse_course_catalogue import (
     get_all_department_courses,
     DATA_DIR,
+    MAX_CONCURRENT_REQUESTS,
+    REQUEST_DELAY,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -72,6 +72,21 @@ class Command(BaseCommand):
 
     help = "Parse course catalog by department for list of all courses in departments"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=MAX_CONCURRENT_REQUESTS,
+            help=f"Number of department pages fetched concurrently (default {MAX_CONCURRENT_REQUESTS}); "
+            f"requests still start {REQUEST_DELAY}s apart, so more workers only "
+            "overlap waiting on the server",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Fetch every page from the server instead of the local HTTP cache",
+        )
+
     def handle(self, *args, **options):
         """Execute the command to retrieve all department course URLs.
 
@@ -87,13 +102,18 @@ class Command(BaseCommand):
             Starting step 1: Getting all department courses...
             Successfully completed step 1!
         """
+        # Configure logging
+        logging.basicConfig(level=logging.INFO)
+
         try:
             # Create data directory if it doesn't exist
             os.makedirs(DATA_DIR, exist_ok=True)
 
             # Step 1: Get all department courses
             logger.info("Starting step 1: Getting all department courses...")
-            department_courses = get_all_department_courses()
+            department_courses = get_all_department_courses(
+                max_workers=options["workers"], use_cache=not options["no_cache"]
+            )
             if not department_courses:
                 raise Exception("Failed to get department courses")
             logger.info("Successfully completed step 1!")
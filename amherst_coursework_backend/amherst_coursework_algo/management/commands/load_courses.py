@@ -28,7 +28,8 @@ The JSON file should follow this schema:
                 "keywords": [str],          // Course topic keywords
                 "offerings": {              // Term offerings mapped to URLs
                     str: str                 // e.g. {"Spring 2024": "https://..."}
-                },
+                },                           // Terms: Fall, Spring, January;
+                                             // "Not offered" is ignored
                 "section_information": {     // Section data keyed by section number
                     str: {                   // Contains professor, time, location info
                         "professor_name": str,
@@ -51,9 +52,18 @@ The JSON file should follow this schema:
         ]
     }
 
+A newline-delimited file (``.ndjson``, as written by ``parse_deg_2``) holds
+one course record per line, each carrying its department under a ``"dept"``
+key. Consecutive lines of the same department are grouped back together.
+
 Notes
 -----
-- Uses atomic transactions for database consistency
+- Courses are written and committed in batches (``--batch-size``, default
+  500); a batch that fails to write is rolled back and reported without
+  undoing earlier batches. Nothing is written while a course record is
+  prepared, so a bad record is reported and skipped without a savepoint
+- Afterwards the search similarity index is rebuilt and stored next to the
+  SQLite database (``masked_filters.save_search_index``)
 - Course ID format: 4DDTCCC where:
     - 4: Amherst College identifier
     - DD: Department number (00-99)
@@ -64,6 +74,9 @@ Notes
 Examples
 --------
 >>> python manage.py load_courses test.json
+>>> python manage.py load_courses test.json --stream  # bounded memory, needs ijson
+>>> python manage.py load_courses test.ndjson  # always read line by line
+>>> python manage.py load_courses test.json --workers 4  # parse records in 4 processes
 
 See Also
 --------
@@ -74,12 +87,17 @@ Functions
 ---------
 """
 
-from django.core.management.base import BaseCommand
+from django.core.management.base import BaseCommand, CommandError
 from django.db import transaction
+from django.db.models import Q
+import mmap
 import os
+from concurrent.futures import ProcessPoolExecutor
 import re
 import time
-from collections import deque
+from collections import defaultdict, deque
+from contextlib import contextmanager
+from functools import lru_cache
 from amherst_coursework_algo.models import (
     Course,
     Department,
@@ -91,17 +109,735 @@ from amherst_coursework_algo.models import (
     Division,
     Keyword,
 )
+from amherst_coursework_algo.masked_filters import save_search_index
 from amherst_coursework_algo.config.course_dictionaries import (
     DEPARTMENT_NAME_TO_NUMBER,
     DEPARTMENT_NAME_TO_CODE,
     MISMATCHED_DEPARTMENT_NAMES,
 )
+import hashlib
 import json
-from datetime import datetime
+from datetime import datetime, time as dt_time
+import django
 from django.conf import settings
 
+try:
+    import orjson
+except ImportError:  # optional: faster decoding of large catalogue files
+    orjson = None
+
+try:
+    import ijson
+except ImportError:  # optional: only needed for --stream
+    ijson = None
+
 INSTITUTIONAL_DOMAIN = settings.INSTITUTIONAL_DOMAIN
 
+# Catalogue files with this suffix hold one course record per line
+NDJSON_SUFFIX = ".ndjson"
+
+# Folded into every course's source hash. Bump it when the way records are
+# turned into rows changes, so the next load rewrites every course instead of
+# skipping the ones whose catalogue record is unchanged.
+LOADER_VERSION = 1
+
+# Per-course log lines are buffered and written once every this many courses
+LOG_FLUSH_INTERVAL = 500
+
+# Courses written and committed per transaction (--batch-size)
+COMMIT_BATCH_SIZE = 500
+
+# Below --verbosity 2, a progress line replaces the per-course success lines
+# once every this many courses
+PROGRESS_INTERVAL = 100
+
+# Maximum number of rows per multi-row INSERT issued by bulk_create
+BULK_BATCH_SIZE = 500
+
+# Course columns the loader writes; rows that already exist have these
+# overwritten by the bulk upsert
+COURSE_UPDATE_FIELDS = (
+    "courseLink",
+    "courseName",
+    "credits",
+    "courseDescription",
+    "placement_course",
+    "professor_override",
+    "prereqDescription",
+    "enrollmentText",
+    "prefForMajor",
+    "overallCap",
+    "freshmanCap",
+    "sophomoreCap",
+    "juniorCap",
+    "seniorCap",
+    "courseMaterialsLink",
+    "summary",
+    "source_hash",
+)
+
+# Section time field prefix -> prefix of the matching keys in a section record
+SECTION_DAYS = {
+    "monday": "mon",
+    "tuesday": "tue",
+    "wednesday": "wed",
+    "thursday": "thu",
+    "friday": "fri",
+    "saturday": "sat",
+    "sunday": "sun",
+}
+
+# Section columns the loader writes; existing (section_for, section_number)
+# rows have these overwritten by the bulk upsert
+SECTION_UPDATE_FIELDS = (
+    *(f"{day}_{edge}_time" for day in SECTION_DAYS for edge in ("start", "end")),
+    "location",
+    "professor",
+)
+
+# Records handed to each worker at a time by --workers
+PREPARE_CHUNK_SIZE = 32
+
+# Department name as it appears in the catalogue -> canonical department
+# name; canonical names map to themselves and take precedence over the
+# MISMATCHED_DEPARTMENT_NAMES aliases
+CANONICAL_DEPARTMENT_NAMES = {
+    **MISMATCHED_DEPARTMENT_NAMES,
+    **{name: name for name in DEPARTMENT_NAME_TO_CODE},
+}
+
+# Offering term name (as in "Fall 2023") -> Course many-to-many field
+OFFERING_TERM_FIELDS = {
+    "Fall": "fallOfferings",
+    "Spring": "springOfferings",
+    "January": "janOfferings",
+}
+
+
+def compute_course_id(department_number: int, course_code: str) -> int:
+    """
+    Derive the 7-digit course ID from a department number and course code.
+
+    Parameters
+    ----------
+    department_number : int
+        Department number from DEPARTMENT_NAME_TO_NUMBER (00-99)
+    course_code : str
+        Primary course code, e.g. 'COSC-111' or 'CHEM-165L'
+
+    Returns
+    -------
+    int
+        Course ID in 4DDTCCC format
+
+    Examples
+    --------
+    >>> compute_course_id(13, 'COSC-111')
+    4130111
+    >>> compute_course_id(10, 'CHEM-165L')
+    4101165
+    """
+    # 4th digit is the half course flag (0 for full, 1 for half)
+    half_flag = 1000 if len(course_code) == 9 else 0
+    # last 3 digits of the course code are the course number
+    return 4000000 + department_number * 10000 + half_flag + int(course_code[5:8])
+
+
+def iter_department_courses(json_file, stream=False):
+    """
+    Yield ``(department, course records)`` pairs from a catalogue file.
+
+    By default the whole file is decoded at once (with orjson, from a
+    read-only memory map, when it is installed). With ``stream=True`` the file is read incrementally with
+    ijson, which picks its fastest available backend (the yajl2_c extension
+    when compiled), so only one department's records are in memory at a time.
+    A streamed file can be iterated again by calling this function again.
+    An ``.ndjson`` file is always read a line at a time, whatever ``stream``.
+
+    Parameters
+    ----------
+    json_file : str
+        Path to the catalogue JSON file
+    stream : bool, optional
+        Parse incrementally with ijson instead of loading the whole file
+
+    Yields
+    ------
+    tuple of (str, list of dict)
+        Department name and its course records
+
+    Raises
+    ------
+    json.JSONDecodeError
+        If the file is not valid JSON (``ijson.JSONError`` when streaming)
+
+    Examples
+    --------
+    >>> for department, courses_data in iter_department_courses("test.json"):
+    ...     print(department, len(courses_data))
+    Computer Science 2
+    """
+    with open(json_file, "rb") as f:
+        if str(json_file).endswith(NDJSON_SUFFIX):
+            loads = orjson.loads if orjson is not None else json.loads
+            department, courses_data = None, []
+            for line in f:
+                if not line.strip():
+                    continue
+                course_data = loads(line)
+                # Records without a department are grouped under None and
+                # rejected by the loader
+                course_department = (
+                    course_data.pop("dept", None)
+                    if isinstance(course_data, dict)
+                    else None
+                )
+                if courses_data and course_department != department:
+                    yield department, courses_data
+                    courses_data = []
+                department = course_department
+                courses_data.append(course_data)
+            if courses_data:
+                yield department, courses_data
+            return
+        if stream:
+            yield from ijson.kvitems(f, "", use_float=True)
+            return
+        if orjson is not None and os.fstat(f.fileno()).st_size:
+            # Decode straight from the mapped file instead of first copying
+            # it into a bytes object. orjson.JSONDecodeError subclasses
+            # json.JSONDecodeError.
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                with memoryview(mm) as view:
+                    departments_courses_data = orjson.loads(view)
+        else:
+            departments_courses_data = json.loads(f.read())
+    yield from departments_courses_data.items()
+
+
+def record_bytes(course_data):
+    """
+    Serialize a course record deterministically for hashing.
+
+    Parameters
+    ----------
+    course_data : dict
+        One course record from the catalogue
+
+    Returns
+    -------
+    bytes
+        JSON encoding of the record with sorted keys
+
+    Examples
+    --------
+    >>> record_bytes({"b": 1, "a": 2})
+    b'{"a":2,"b":1}'
+    """
+    if orjson is not None:
+        return orjson.dumps(course_data, option=orjson.OPT_SORT_KEYS)
+    return json.dumps(course_data, sort_keys=True, separators=(",", ":")).encode()
+
+
+def validate_course_record(course_data):
+    """
+    Check that a course record has the fields every course needs.
+
+    Cheap key tests run before a record is prepared or looked up, so records
+    that are missing required fields are rejected up front rather than by
+    an exception part-way through loading them.
+
+    Parameters
+    ----------
+    course_data : dict
+        One course record from the catalogue
+
+    Returns
+    -------
+    str or None
+        Why the record cannot be loaded, or None if it can
+
+    Examples
+    --------
+    >>> validate_course_record({"course_name": "Intro", "description": ""})
+    'No course codes found for course'
+    """
+    if not isinstance(course_data, dict):
+        return "Course record is not an object"
+    if not course_data.get("course_acronyms"):
+        return "No course codes found for course"
+    for field in ("course_name", "description"):
+        if field not in course_data:
+            return f"Missing required field {field!r}"
+    return None
+
+
+def collect_lookup_rows(departments_courses_data):
+    """
+    Gather every distinct Division, Keyword, Department, CourseCode,
+    Professor and Year row the load will reference, the IDs of courses named as prerequisites,
+    placements or corequisites, and a digest for each course being loaded.
+
+    A course's digest covers every record saved under its ID, in file order,
+    since later records for the same ID overwrite earlier ones.
+
+    Mirrors the lookups done per course in ``Command.handle`` so the rows can
+    be fetched or created up front with a handful of batched queries.
+    Malformed records are passed over here; ``handle`` reports them when it
+    reaches them.
+
+    Parameters
+    ----------
+    departments_courses_data : iterable of tuple(str, list of dict)
+        ``(department, course records)`` pairs, as yielded by
+        ``iter_department_courses``
+
+    Returns
+    -------
+    tuple of (dict, dict)
+        Model class -> {lookup key tuple: field values for a new row}, and
+        course ID -> hex digest of the records saved under that ID
+
+    Examples
+    --------
+    >>> rows, course_hashes = collect_lookup_rows(
+    ...     [("Computer Science", [course_data])]
+    ... )
+    >>> rows[CourseCode]
+    {('COSC-111',): {'value': 'COSC-111'}}
+    >>> list(course_hashes)
+    [4130111]
+    """
+    rows = {
+        Division: {},
+        Keyword: {},
+        Department: {},
+        CourseCode: {},
+        Professor: {},
+        Year: {},
+        Course: {},
+    }
+    # Placeholder professor for courses without section information
+    rows[Professor][("TBA", INSTITUTIONAL_DOMAIN)] = {
+        "name": "TBA",
+        "link": INSTITUTIONAL_DOMAIN,
+    }
+    course_hashes = {}
+
+    for department, courses_data in departments_courses_data:
+        if department is None:
+            # rejected by handle before anything is looked up
+            continue
+        for course_data in courses_data:
+            try:
+                if validate_course_record(course_data) is not None:
+                    # rejected by handle before anything is looked up
+                    continue
+                for name in course_data.get("divisions", []):
+                    rows[Division].setdefault((name,), {"name": name})
+                for name in course_data.get("keywords", []):
+                    rows[Keyword].setdefault((name,), {"name": name})
+                for code in course_data["course_acronyms"]:
+                    rows[CourseCode].setdefault((code,), {"value": code})
+
+                deptList = course_data.get("departments") or {
+                    "Other": INSTITUTIONAL_DOMAIN
+                }
+                dept_names = []
+                for department, link in deptList.items():
+                    name = CANONICAL_DEPARTMENT_NAMES.get(department)
+                    if name is not None:
+                        dept_names.append(name)
+                        rows[Department].setdefault(
+                            (name,),
+                            {
+                                "name": name,
+                                "code": DEPARTMENT_NAME_TO_CODE[name],
+                                "link": link,
+                            },
+                        )
+
+                prerequisites = course_data.get("prerequisites") or {}
+                referenced = list(prerequisites.get("recommended", []))
+                if prerequisites.get("placement"):
+                    referenced.append(prerequisites["placement"])
+                referenced.extend(course_data.get("corequisites") or [])
+                for course_id in referenced:
+                    rows[Course].setdefault((course_id,), {"id": course_id})
+
+                for offering, link in (course_data.get("offerings") or {}).items():
+                    term, _, year_part = offering.rpartition(" ")
+                    if term in OFFERING_TERM_FIELDS:
+                        year = int(year_part)
+                        rows[Year].setdefault(
+                            (year, link), {"year": year, "link": link}
+                        )
+
+                for reqSet in prerequisites.get("required", []):
+                    for course_id in reqSet:
+                        rows[Course].setdefault((course_id,), {"id": course_id})
+
+                section_information = course_data.get("section_information") or {}
+                for section_data in section_information.values():
+                    name = section_data.get("professor_name") or "Unknown Professor"
+                    link = section_data.get("professor_link") or INSTITUTIONAL_DOMAIN
+                    rows[Professor].setdefault(
+                        (name, link), {"name": name, "link": link}
+                    )
+
+                if dept_names and dept_names[0] in DEPARTMENT_NAME_TO_NUMBER:
+                    course_id = compute_course_id(
+                        DEPARTMENT_NAME_TO_NUMBER[dept_names[0]],
+                        course_data["course_acronyms"][0],
+                    )
+                    if course_id not in course_hashes:
+                        course_hashes[course_id] = hashlib.blake2b(
+                            str(LOADER_VERSION).encode(), digest_size=16
+                        )
+                    course_hashes[course_id].update(record_bytes(course_data))
+            except Exception:
+                continue
+
+    return rows, {
+        course_id: digest.hexdigest() for course_id, digest in course_hashes.items()
+    }
+
+
+def bulk_get_or_create(model, lookup_fields, rows, only=None):
+    """
+    Fetch or create one row per lookup key using batched queries.
+
+    Behaves like calling ``get_or_create`` once per key, but issues one
+    SELECT for the existing rows, one batched INSERT for the missing ones and
+    one SELECT to read them back. Where several rows already share a key the
+    oldest one is used.
+
+    Parameters
+    ----------
+    model : type[django.db.models.Model]
+        Model to look up
+    lookup_fields : tuple of str
+        Fields making up the lookup key, in key order
+    rows : dict
+        Lookup key tuple -> field values used if the row has to be created
+    only : tuple of str, optional
+        Load only these fields of the returned instances (must include the
+        lookup fields); others are deferred
+
+    Returns
+    -------
+    dict
+        Lookup key tuple -> model instance
+
+    Examples
+    --------
+    >>> bulk_get_or_create(CourseCode, ("value",), {("COSC-111",): {"value": "COSC-111"}})
+    {('COSC-111',): <CourseCode: COSC-111>}
+    """
+
+    def fetch():
+        found = {}
+        first_values = {key[0] for key in rows}
+        queryset = model.objects.filter(
+            **{f"{lookup_fields[0]}__in": first_values}
+        ).order_by("pk")
+        if only is not None:
+            queryset = queryset.only(*only)
+        for obj in queryset:
+            key = tuple(getattr(obj, field) for field in lookup_fields)
+            if key in rows:
+                found.setdefault(key, obj)
+        return found
+
+    if not rows:
+        return {}
+    found = fetch()
+    missing = [model(**values) for key, values in rows.items() if key not in found]
+    if missing:
+        model.objects.bulk_create(missing, batch_size=BULK_BATCH_SIZE)
+        found = fetch()
+    return found
+
+
+def existing_prerequisite_keys(course_ids):
+    """
+    Return the dedup keys of the prerequisite sets already stored for courses.
+
+    Parameters
+    ----------
+    course_ids : set of int
+        Courses whose prerequisite sets should be read
+
+    Returns
+    -------
+    set of tuple(int, frozenset of int)
+        ``(course ID, member course IDs)`` for every stored PrerequisiteSet
+
+    Examples
+    --------
+    >>> existing_prerequisite_keys({4130211})
+    {(4130211, frozenset({4130111}))}
+    """
+    set_courses = dict(
+        PrerequisiteSet.objects.filter(prerequisite_for_id__in=course_ids).values_list(
+            "id", "prerequisite_for_id"
+        )
+    )
+    members = defaultdict(set)
+    for set_id, course_id in PrerequisiteSet.courses.through.objects.filter(
+        prerequisiteset_id__in=set_courses.keys()
+    ).values_list("prerequisiteset_id", "course_id"):
+        members[set_id].add(course_id)
+    return {
+        (course_id, frozenset(members[set_id]))
+        for set_id, course_id in set_courses.items()
+    }
+
+
+def replace_m2m_links(field, assignments):
+    """
+    Apply a sequence of ``.set()`` calls on a Course many-to-many field in bulk.
+
+    The rows for every course in ``assignments`` are deleted with one query
+    and the resulting links inserted with batched multi-row INSERTs. Later
+    assignments for the same course replace earlier ones. For a symmetrical
+    relation (``corequisites``) the calls are replayed in order so that the
+    mirrored rows end up as they would after calling ``.set()`` one by one.
+
+    Parameters
+    ----------
+    field : django.db.models.ManyToManyField
+        Many-to-many field on Course, e.g. ``Course._meta.get_field("keywords")``
+    assignments : list of tuple(int, list of int)
+        ``(course_id, related_ids)`` pairs in the order they were made
+
+    Returns
+    -------
+    None
+
+    Examples
+    --------
+    >>> replace_m2m_links(Course._meta.get_field("keywords"), [(4130111, [1, 2])])
+    """
+    through = field.remote_field.through
+    source = f"{field.m2m_field_name()}_id"
+    target = f"{field.m2m_reverse_field_name()}_id"
+
+    if field.remote_field.symmetrical:
+        course_ids = {course_id for course_id, _ in assignments}
+        links = defaultdict(set)
+        for from_id, to_id in through.objects.filter(
+            **{f"{source}__in": course_ids}
+        ).values_list(source, target):
+            links[from_id].add(to_id)
+        for course_id, related_ids in assignments:
+            related_ids = set(related_ids)
+            for other in links[course_id] - related_ids:
+                links[other].discard(course_id)
+            for other in related_ids - links[course_id]:
+                links[other].add(course_id)
+            links[course_id] = related_ids
+        pairs = {
+            pair
+            for course_id in course_ids
+            for other in links[course_id]
+            for pair in ((course_id, other), (other, course_id))
+        }
+        through.objects.filter(
+            Q(**{f"{source}__in": course_ids}) | Q(**{f"{target}__in": course_ids})
+        ).delete()
+    else:
+        latest = dict(assignments)
+        course_ids = latest.keys()
+        pairs = {
+            (course_id, related_id)
+            for course_id, related_ids in latest.items()
+            for related_id in related_ids
+        }
+        through.objects.filter(**{f"{source}__in": course_ids}).delete()
+
+    through.objects.bulk_create(
+        [through(**{source: from_id, target: to_id}) for from_id, to_id in pairs],
+        batch_size=BULK_BATCH_SIZE,
+        ignore_conflicts=True,
+    )
+
+
+def prepare_course(course_data):
+    """
+    Derive what the loader needs from one course record, without the database.
+
+    This is the CPU-bound half of loading a course: resolving department
+    names, splitting offerings into terms, computing the course ID and
+    parsing section times. It only returns plain Python values, so it can
+    run in a worker process. Lookups of rows by these values, and all
+    writes, happen in the main process.
+
+    Values are filled in the order the loader used to compute them. If the
+    record is malformed, the exception is stored under ``"error"`` and the
+    values derived before it are kept, so the caller can report them
+    before failing or skipping the record.
+
+    Parameters
+    ----------
+    course_data : dict
+        One course record from the catalogue
+
+    Returns
+    -------
+    dict
+        ``codes``, ``department_warning``, ``department_names``,
+        ``invalid_departments``, ``recommended``, ``placement``,
+        ``corequisites``, ``term_offerings`` (field -> list of
+        ``(year, link)``), ``unknown_terms``, ``invalid_department``, ``id``,
+        ``course_fields``, ``required``, ``sections`` (list of
+        ``(section_number, professor key, Section field values)``) and
+        ``error``
+
+    Examples
+    --------
+    >>> prepared = prepare_course(course_data)
+    >>> prepared["id"], prepared["codes"]
+    (4130111, ['COSC-111'])
+    """
+    prepared = {
+        "codes": [],
+        "department_warning": None,
+        "department_names": [],
+        "invalid_departments": [],
+        "recommended": [],
+        "placement": None,
+        "corequisites": [],
+        "term_offerings": {field: [] for field in OFFERING_TERM_FIELDS.values()},
+        "unknown_terms": [],
+        "invalid_department": None,
+        "id": None,
+        "course_fields": None,
+        "required": [],
+        "sections": [],
+        "error": None,
+    }
+    try:
+        prerequisites = course_data.get("prerequisites") or {}
+        overGuidelines = course_data.get("overGuidelines") or {}
+        offerings = course_data.get("offerings") or {}
+        section_information = course_data.get("section_information") or {}
+
+        acronyms = course_data.get("course_acronyms")
+        if not acronyms:
+            raise KeyError("No course codes found for course")
+        prepared["codes"] = list(acronyms)
+
+        deptList = course_data.get("departments")
+        if not deptList:
+            deptList = {"Other": INSTITUTIONAL_DOMAIN}
+            prepared["department_warning"] = (
+                f"Department not found for {course_data['course_name']}"
+            )
+        for department in deptList:
+            name = CANONICAL_DEPARTMENT_NAMES.get(department)
+            if name is None:
+                prepared["invalid_departments"].append(department)
+                continue
+            prepared["department_names"].append(name)
+
+        prepared["recommended"] = list(prerequisites.get("recommended", []))
+        prepared["placement"] = prerequisites.get("placement") or None
+        prepared["corequisites"] = list(course_data.get("corequisites") or [])
+
+        for offering, link in offerings.items():
+            if offering == "Not offered":
+                continue
+            # e.g. "Fall 2023" -> ("Fall", "2023")
+            term, _, year_part = offering.rpartition(" ")
+            field = OFFERING_TERM_FIELDS.get(term)
+            if field is None:
+                prepared["unknown_terms"].append(term)
+                continue
+            prepared["term_offerings"][field].append((int(year_part), link))
+
+        department_name = prepared["department_names"][0]
+        if department_name not in DEPARTMENT_NAME_TO_NUMBER:
+            prepared["invalid_department"] = department_name
+            return prepared
+        prepared["id"] = compute_course_id(
+            DEPARTMENT_NAME_TO_NUMBER[department_name], prepared["codes"][0]
+        )
+
+        first_section = next(iter(section_information.values()), {})
+        prepared["course_fields"] = {
+            "courseLink": course_data.get("course_url", ""),
+            "courseName": course_data["course_name"],
+            "credits": course_data.get("credits", 4),
+            "courseDescription": course_data["description"],
+            "professor_override": prerequisites.get("professor_override", False),
+            "prereqDescription": prerequisites.get("text", ""),
+            "enrollmentText": overGuidelines.get("text", ""),
+            "prefForMajor": overGuidelines.get("preferenceForMajor", False),
+            "overallCap": overGuidelines.get("overallCap", 0),
+            "freshmanCap": overGuidelines.get("freshmanCap", 0),
+            "sophomoreCap": overGuidelines.get("sophomoreCap", 0),
+            "juniorCap": overGuidelines.get("juniorCap", 0),
+            "seniorCap": overGuidelines.get("seniorCap", 0),
+            "courseMaterialsLink": first_section.get(
+                "course_materials_links", INSTITUTIONAL_DOMAIN
+            ),
+        }
+
+        prepared["required"] = [
+            list(reqSet) for reqSet in prerequisites.get("required", [])
+        ]
+
+        for section_number, section_data in section_information.items():
+            professor_key = (
+                section_data.get("professor_name") or "Unknown Professor",
+                section_data.get("professor_link") or INSTITUTIONAL_DOMAIN,
+            )
+            fields = {}
+            for day, prefix in SECTION_DAYS.items():
+                fields[f"{day}_start_time"] = Command.parse_ampm_time(
+                    section_data.get(f"{prefix}_start_time")
+                )
+                fields[f"{day}_end_time"] = Command.parse_ampm_time(
+                    section_data.get(f"{prefix}_end_time")
+                )
+            fields["location"] = section_data.get("course_location", "Unknown Location")
+            prepared["sections"].append((section_number, professor_key, fields))
+    except Exception as e:
+        prepared["error"] = e
+    return prepared
+
+
+@contextmanager
+def course_preparer(workers=1):
+    """
+    Provide a function that runs prepare_course over a list of records.
+
+    With more than one worker the records are prepared in a process pool,
+    which is shut down when the block exits. Results come back in input
+    order either way.
+
+    Parameters
+    ----------
+    workers : int
+        Number of worker processes; 1 prepares records in this process
+
+    Examples
+    --------
+    >>> with course_preparer(4) as prepare:
+    ...     for course_data, prepared in zip(records, prepare(records)):
+    ...         ...
+    """
+    if workers <= 1:
+        yield lambda records: map(prepare_course, records)
+        return
+    # Workers set Django up themselves so they can start by spawn as well
+    # as by fork
+    with ProcessPoolExecutor(max_workers=workers, initializer=django.setup) as pool:
+        yield lambda records: pool.map(
+            prepare_course, records, chunksize=PREPARE_CHUNK_SIZE
+        )
+
 
 class Command(BaseCommand):
     # Rate limiting configuration (can be overridden by env)
@@ -208,10 +944,15 @@ class Command(BaseCommand):
             Command._gemini_call_times.append(call_started_at)
             Command._gemini_total_calls += 1
 
+    @lru_cache(maxsize=256)
     def parse_ampm_time(time_str):
         """
         Parse a time string in AM/PM format into a Django time object.
 
+        Results are memoized: a catalogue only uses a few dozen distinct
+        meeting times across thousands of section fields. Well-formed
+        strings are split by hand; anything else goes through strptime.
+
         Parameters
         ----------
         time_str : str
@@ -233,6 +974,23 @@ class Command(BaseCommand):
         """
         if not time_str or time_str == "null":
             return None
+        # e.g. "9:00 AM" -> ("9", "00", "AM")
+        clock, _, meridiem = time_str.partition(" ")
+        hours, _, minutes = clock.partition(":")
+        meridiem = meridiem.upper()
+        if (
+            clock.isascii()
+            and hours.isdecimal()
+            and len(hours) <= 2
+            and minutes.isdecimal()
+            and len(minutes) <= 2
+            and 1 <= int(hours) <= 12
+            and int(minutes) <= 59
+            and meridiem in ("AM", "PM")
+        ):
+            return dt_time(
+                int(hours) % 12 + (12 if meridiem == "PM" else 0), int(minutes)
+            )
         try:
             # Parse time like "9:00 AM" into Django time object
             parsed_time = datetime.strptime(time_str, "%I:%M %p")
@@ -250,8 +1008,29 @@ class Command(BaseCommand):
             action="store_true",
             help="Skip malformed course records and continue loading remaining courses",
         )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Reload every course, even those whose catalogue record is unchanged",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=COMMIT_BATCH_SIZE,
+            help=f"Number of courses written per transaction (default {COMMIT_BATCH_SIZE})",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of processes used to parse course records (default 1)",
+        )
+        parser.add_argument(
+            "--stream",
+            action="store_true",
+            help="Parse the JSON file incrementally with ijson to bound memory use",
+        )
 
-    @transaction.atomic
     def handle(self, *args, **options):
         """Process JSON course data and load into database.
 
@@ -270,8 +1049,9 @@ class Command(BaseCommand):
         ------
         ValueError
             If course ID is invalid (not 1000000-9999999)
-        Exception
-            If error occurs during database operations
+        CommandError
+            After the load, if any record failed to load; malformed records
+            skipped with ``--skip-bad-records`` do not count
 
 
         Operation Flow
@@ -289,328 +1069,407 @@ class Command(BaseCommand):
             * Creates/updates sections
         """
 
-        with open(options["json_file"]) as f:
-            departments_courses_data = json.load(f)
+        ndjson = options["json_file"].endswith(NDJSON_SUFFIX)
+        if options.get("stream", False) or ndjson:
+            if ijson is None and not ndjson:
+                raise CommandError("--stream requires the ijson package")
+            # streaming is forward-only: the pre-pass and the load each
+            # read the file once
+            departments_courses_data = None
+        else:
+            departments_courses_data = list(
+                iter_department_courses(options["json_file"])
+            )
+
+        def department_courses():
+            if departments_courses_data is not None:
+                return departments_courses_data
+            return iter_department_courses(options["json_file"], stream=True)
 
         skipped_records = 0
+        failed_records = 0
+        # Validation errors are collected and written once after the loop so
+        # the transaction isn't interleaved with terminal writes.
+        errors = []
+        unknown_terms = set()
+        # Required prerequisite groups are inserted together per batch:
+        # one INSERT for the sets and one for their course links. Keyed by
+        # (course ID, member IDs) so a group is only stored once per course.
+        prereq_sets = {}
+        log_lines = []
+        processed = 0
+        loaded = 0
+        # Value of loaded when the last batch was committed
+        written = 0
+        batch_size = options.get("batch_size") or COMMIT_BATCH_SIZE
+        verbose = options.get("verbosity", 1) >= 2
 
-        for department_list in departments_courses_data:
-            courses_data = departments_courses_data[department_list]
-            for course_data in courses_data:
-                try:
+        def flush_log():
+            if log_lines:
+                self.stdout.write("\n".join(log_lines))
+                log_lines.clear()
 
-                    divisions = []
-                    for division in course_data.get("divisions", []):
-                        division, _ = Division.objects.get_or_create(
-                            name=division,
-                        )
-                        divisions.append(division)
+        # Lookup rows are committed before any course so every batch can
+        # refer to them
+        with transaction.atomic():
+            lookup_rows, course_hashes = collect_lookup_rows(department_courses())
+            division_by_name = bulk_get_or_create(
+                Division, ("name",), lookup_rows[Division]
+            )
+            keyword_by_name = bulk_get_or_create(
+                Keyword, ("name",), lookup_rows[Keyword]
+            )
+            dept_by_name = bulk_get_or_create(
+                Department, ("name",), lookup_rows[Department]
+            )
+            code_by_value = bulk_get_or_create(
+                CourseCode, ("value",), lookup_rows[CourseCode]
+            )
+            prof_by_key = bulk_get_or_create(
+                Professor, ("name", "link"), lookup_rows[Professor]
+            )
+            year_by_key = bulk_get_or_create(Year, ("year", "link"), lookup_rows[Year])
+            # Courses referenced by other courses exist as stubs until their own
+            # record (if any) fills them in. Only their IDs are needed to link
+            # to them; courses being loaded are read in full below.
+            course_by_id = {
+                key[0]: course
+                for key, course in bulk_get_or_create(
+                    Course, ("id",), lookup_rows[Course], only=("id",)
+                ).items()
+            }
+            loaded_courses = Course.objects.in_bulk(course_hashes.keys())
+            course_by_id.update(loaded_courses)
+        # Hashes as stored before this load; stubs and never-loaded courses
+        # have none. Courses whose records hash the same are left untouched,
+        # unless the stored row is incomplete: a course still missing its AI
+        # summary is reloaded so the summary is retried, but only when one
+        # can be generated at all.
+        can_summarize = bool(os.getenv("GEMINI_API_KEY"))
+        stored_hashes = {
+            course_id: course.source_hash
+            for course_id, course in loaded_courses.items()
+            if course.source_hash and (course.summary or not can_summarize)
+        }
+        unchanged_ids = set()
+        # Courses with real (not placeholder) sections, stored or collected by
+        # this load. Only a course with none gets the placeholder section, so
+        # a record without section information leaves real sections alone.
+        courses_with_sections = set(
+            Section.objects.exclude(location="TBA", professor__name="TBA")
+            .values_list("section_for_id", flat=True)
+            .distinct()
+        )
+        # Loaded courses of the current batch, written with one bulk upsert
+        # by write_batch(). Foreign keys to these rows are deferred until
+        # commit, so sections may be inserted before it runs.
+        courses_to_save = {}
+        # Many-to-many .set() calls, replayed in bulk per field per batch
+        m2m_assignments = defaultdict(list)
+        # Sections of the batch, upserted after its courses, keyed by
+        # (course ID, section number). Placeholder sections for courses
+        # without any sections are kept apart: like update_or_create they
+        # only set the professor and location of an existing row.
+        sections_to_save = {}
+        dummy_sections = {}
 
-                    keywords = []
-                    for keyword in course_data.get("keywords", []):
-                        keyword, _ = Keyword.objects.get_or_create(
-                            name=keyword,
-                        )
-                        keywords.append(keyword)
+        def reject(course_data, reason):
+            """Report a course record that could not be loaded."""
+            nonlocal skipped_records, failed_records
+            if options.get("skip_bad_records", False):
+                skipped_records += 1
+                log_lines.append(
+                    self.style.WARNING(
+                        f"Skipping malformed course record due to error: {reason} for {course_data}"
+                    )
+                )
+            else:
+                failed_records += 1
+                errors.append(f"Failed to create course: {reason} for {course_data}")
 
-                    codes = []
-                    if len(course_data.get("course_acronyms", [])) == 0:
-                        raise KeyError("No course codes found for course")
+        def write_batch():
+            """Write the courses collected so far in one transaction."""
+            nonlocal loaded, written, failed_records
+            try:
+                with transaction.atomic():
+                    # INSERT ... ON CONFLICT (id) DO UPDATE
+                    Course.objects.bulk_create(
+                        courses_to_save.values(),
+                        update_conflicts=True,
+                        unique_fields=["id"],
+                        update_fields=COURSE_UPDATE_FIELDS,
+                        batch_size=BULK_BATCH_SIZE,
+                    )
+                    # INSERT ... ON CONFLICT (section_for_id, section_number) DO UPDATE
+                    Section.objects.bulk_create(
+                        sections_to_save.values(),
+                        update_conflicts=True,
+                        unique_fields=["section_for", "section_number"],
+                        update_fields=SECTION_UPDATE_FIELDS,
+                        batch_size=BULK_BATCH_SIZE,
+                    )
+                    Section.objects.bulk_create(
+                        dummy_sections.values(),
+                        update_conflicts=True,
+                        unique_fields=["section_for", "section_number"],
+                        update_fields=["professor", "location"],
+                        batch_size=BULK_BATCH_SIZE,
+                    )
+                    for field, assignments in m2m_assignments.items():
+                        replace_m2m_links(Course._meta.get_field(field), assignments)
 
-                    for code in course_data.get("course_acronyms", []):
-                        code, _ = CourseCode.objects.get_or_create(
-                            value=code,
-                        )
-                        codes.append(code)
-
-                    departments = []
-                    deptList = course_data.get("departments", {})
-                    if len(deptList) == 0:
-                        deptList = {"Other": INSTITUTIONAL_DOMAIN}
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Department not found for {course_data['course_name']}"
+                    # Groups already stored by an earlier load are not inserted again
+                    for key in existing_prerequisite_keys(
+                        {key[0] for key in prereq_sets}
+                    ):
+                        prereq_sets.pop(key, None)
+                    new_sets = list(prereq_sets.values())
+                    # bulk_create fills in the primary keys the link rows refer to
+                    PrerequisiteSet.objects.bulk_create(
+                        [prereq_set for prereq_set, _ in new_sets],
+                        batch_size=BULK_BATCH_SIZE,
+                    )
+                    PrerequisiteSetCourse = PrerequisiteSet.courses.through
+                    PrerequisiteSetCourse.objects.bulk_create(
+                        [
+                            PrerequisiteSetCourse(
+                                prerequisiteset_id=prereq_set.id, course_id=c.id
                             )
+                            for prereq_set, courses in new_sets
+                            for c in courses
+                        ],
+                        batch_size=BULK_BATCH_SIZE,
+                        ignore_conflicts=True,
+                    )
+                written = loaded
+            except Exception as e:
+                # Earlier batches stay committed; this one is rolled back
+                failed_records += loaded - written
+                errors.append(
+                    f"Failed to write a batch of {loaded - written} course record(s): {str(e)}"
+                )
+                loaded = written
+            courses_to_save.clear()
+            m2m_assignments.clear()
+            prereq_sets.clear()
+            sections_to_save.clear()
+            dummy_sections.clear()
+
+        with course_preparer(options.get("workers", 1)) as prepare:
+            for department, courses_data in department_courses():
+                if department is None:
+                    # NDJSON lines without a "dept" field
+                    for course_data in courses_data:
+                        processed += 1
+                        reject(
+                            course_data,
+                            validate_course_record(course_data)
+                            or "Missing required field 'dept'",
                         )
-                        print(deptList)
-                    i = 0
-                    for department, link in deptList.items():
-                        try:
-                            if department not in DEPARTMENT_NAME_TO_CODE:
-                                department = MISMATCHED_DEPARTMENT_NAMES[department]
-                            dept, _ = Department.objects.get_or_create(
-                                name=department,
-                                defaults={
-                                    "code": DEPARTMENT_NAME_TO_CODE[department],
-                                    "link": link,
-                                },
+                    continue
+                for course_data, prepared in zip(courses_data, prepare(courses_data)):
+                    processed += 1
+                    if processed % LOG_FLUSH_INTERVAL == 0:
+                        flush_log()
+                    if len(courses_to_save) >= batch_size:
+                        write_batch()
+                    problem = validate_course_record(course_data)
+                    if problem is not None:
+                        reject(course_data, problem)
+                        continue
+                    try:
+                        divisions = [
+                            division_by_name[(name,)]
+                            for name in course_data.get("divisions", [])
+                        ]
+                        keywords = [
+                            keyword_by_name[(name,)]
+                            for name in course_data.get("keywords", [])
+                        ]
+
+                        codes = [code_by_value[(code,)] for code in prepared["codes"]]
+
+                        if prepared["department_warning"]:
+                            log_lines.append(
+                                self.style.WARNING(prepared["department_warning"])
                             )
-                        except Exception:
-                            self.stdout.write(
-                                self.style.ERROR(
-                                    f"Failed to create course: {department} is not a valid department"
-                                )
+                        for department in prepared["invalid_departments"]:
+                            errors.append(
+                                f"Failed to create course: {department} is not a valid department"
                             )
-                            continue
-                        departments.append(dept)
-                        i += 1
-
-                    recommended = [
-                        Course.objects.get_or_create(id=rec)[0]
-                        for rec in course_data.get("prerequisites", {}).get(
-                            "recommended", []
-                        )
-                    ]
+                        departments = [
+                            dept_by_name[(name,)]
+                            for name in prepared["department_names"]
+                        ]
 
-                    placement_id = course_data.get("prerequisites", {}).get("placement")
-                    placementCourse = None
-                    if placement_id:
-                        placementCourse, _ = Course.objects.get_or_create(
-                            id=placement_id
-                        )
+                        recommended = [
+                            course_by_id[rec] for rec in prepared["recommended"]
+                        ]
 
-                    corequisites = [
-                        Course.objects.get_or_create(id=rec)[0]
-                        for rec in course_data.get("corequisites", {})
-                    ]
+                        placementCourse = None
+                        if prepared["placement"]:
+                            placementCourse = course_by_id[prepared["placement"]]
 
-                    fallOfferings = []
-                    springOfferings = []
-                    janOfferings = []
+                        corequisites = [
+                            course_by_id[rec] for rec in prepared["corequisites"]
+                        ]
 
-                    offerings = course_data.get("offerings", {})
-                    for offering, link in offerings.items():
-                        if offering == "Not offered":
-                            continue
-                        year, _ = Year.objects.get_or_create(
-                            year=int(offering.split()[-1]),
-                            link=link,
-                        )
-                        term = offering.split()[0]
-                        if term == "Fall":
-                            fallOfferings.append(year)
-                        elif term == "Spring":
-                            springOfferings.append(year)
-                        elif term == "January":
-                            janOfferings.append(year)
-                        else:
-                            self.stdout.write(
-                                self.style.ERROR(
+                        for term in prepared["unknown_terms"]:
+                            # reported once per unknown term, not per offering
+                            if term not in unknown_terms:
+                                unknown_terms.add(term)
+                                errors.append(
                                     f"Failed to create course: {term} is not a valid term"
                                 )
+                        term_offerings = {
+                            field: [year_by_key[key] for key in keys]
+                            for field, keys in prepared["term_offerings"].items()
+                        }
+
+                        if prepared["error"] is not None:
+                            raise prepared["error"]
+
+                        if prepared["invalid_department"] is not None:
+                            errors.append(
+                                f"Failed to create course: {prepared['invalid_department']} is not a valid department"
                             )
                             continue
+                        id = prepared["id"]
 
-                    id = 4000000
-                    try:
-                        id += (
-                            DEPARTMENT_NAME_TO_NUMBER[departments[0].name] * 10000
-                        )  # the second 2 digits are the department number
-                    except KeyError:
-                        self.stdout.write(
-                            self.style.ERROR(
-                                f"Failed to create course: {departments[0].name} is not a valid department"
+                        if (
+                            not options.get("force", False)
+                            and id in stored_hashes
+                            and stored_hashes[id] == course_hashes.get(id)
+                        ):
+                            unchanged_ids.add(id)
+                            continue
+
+                        course = course_by_id.get(id)
+                        if course is None:
+                            course = course_by_id[id] = Course(id=id)
+
+                        professors = []
+                        sections = []
+                        for section_number, professor_key, fields in prepared[
+                            "sections"
+                        ]:
+                            sectionProfessor = prof_by_key[professor_key]
+                            sections.append(
+                                Section(
+                                    section_number=section_number,
+                                    section_for=course,
+                                    professor=sectionProfessor,
+                                    **fields,
+                                )
                             )
-                        )
-                        continue
-                    if len(codes[0].value) == 9:
-                        id += 1000  # 4th digit is half course flag (0 for full, 1 for half)
-                    id += int(
-                        codes[0].value[5:8]
-                    )  # last 3 characters of course code are the course number
-
-                    # Create course
-                    course, _ = Course.objects.update_or_create(
-                        id=id,
-                        defaults={
-                            "courseLink": course_data.get("course_url", ""),
-                            "courseName": course_data["course_name"],
-                            "credits": course_data.get("credits", 4),
-                            "courseDescription": course_data["description"],
-                            "placement_course": placementCourse,
-                            "professor_override": course_data.get(
-                                "prerequisites", {}
-                            ).get("professor_override", False),
-                            "prereqDescription": course_data.get(
-                                "prerequisites", {}
-                            ).get("text", ""),
-                            "enrollmentText": course_data.get("overGuidelines", {}).get(
-                                "text", ""
-                            ),
-                            "prefForMajor": course_data.get("overGuidelines", {}).get(
-                                "preferenceForMajor", False
-                            ),
-                            "overallCap": course_data.get("overGuidelines", {}).get(
-                                "overallCap", 0
-                            ),
-                            "freshmanCap": course_data.get("overGuidelines", {}).get(
-                                "freshmanCap", 0
-                            ),
-                            "sophomoreCap": course_data.get("overGuidelines", {}).get(
-                                "sophomoreCap", 0
-                            ),
-                            "juniorCap": course_data.get("overGuidelines", {}).get(
-                                "juniorCap", 0
-                            ),
-                            "seniorCap": course_data.get("overGuidelines", {}).get(
-                                "seniorCap", 0
-                            ),
-                        },
-                    )
+                            professors.append(sectionProfessor)
 
-                    # Generate AI summary once per course if missing
-                    if not getattr(course, "summary", ""):
-                        summary_text = Command.generate_course_summary(
-                            course.courseName,
-                            course.courseDescription,
-                        )
-                        if summary_text:
-                            course.summary = summary_text
-                            course.save(update_fields=["summary"])
-
-                    course.courseCodes.set(codes)
-                    course.departments.set(departments)
-                    course.corequisites.set(corequisites)
-                    course.fallOfferings.set(fallOfferings)
-                    course.springOfferings.set(springOfferings)
-                    course.janOfferings.set(janOfferings)
-                    course.divisions.set(divisions)
-                    course.keywords.set(keywords)
-                    course.recommended_courses.set(recommended)
-
-                    for reqSet in course_data.get("prerequisites", {}).get(
-                        "required", []
-                    ):
-                        prereq_set = PrerequisiteSet.objects.create(
-                            prerequisite_for=course,
-                        )
-                        courses = [
-                            Course.objects.get_or_create(id=req)[0] for req in reqSet
-                        ]
-                        prereq_set.courses.set(courses)
-
-                    course.save()
-
-                    professors = []
-                    sections = []
-                    i = 0
-                    courseMaterialsLink = INSTITUTIONAL_DOMAIN
-                    for section_number, section_data in course_data.get(
-                        "section_information", {}
-                    ).items():
-                        if i == 0:
-                            courseMaterialsLink = section_data.get(
-                                "course_materials_links", INSTITUTIONAL_DOMAIN
+                        needs_dummy = not sections and id not in courses_with_sections
+                        if needs_dummy:
+                            dummy_professor = prof_by_key[("TBA", INSTITUTIONAL_DOMAIN)]
+                            professors.append(dummy_professor)
+                            log_lines.append(
+                                self.style.WARNING(
+                                    f'Added dummy section for course "{prepared["course_fields"]["courseName"]}"'
+                                )
                             )
-                        sectionProfessor, _ = Professor.objects.get_or_create(
-                            name=(
-                                section_data.get("professor_name")
-                                or "Unknown Professor"
-                            ),
-                            link=(
-                                section_data.get("professor_link")
-                                or INSTITUTIONAL_DOMAIN
-                            ),
-                        )
-                        section, _ = Section.objects.update_or_create(
-                            section_number=section_number,
-                            section_for=course,
-                            defaults={
-                                "monday_start_time": Command.parse_ampm_time(
-                                    section_data.get("mon_start_time")
-                                ),
-                                "monday_end_time": Command.parse_ampm_time(
-                                    section_data.get("mon_end_time")
-                                ),
-                                "tuesday_start_time": Command.parse_ampm_time(
-                                    section_data.get("tue_start_time")
-                                ),
-                                "tuesday_end_time": Command.parse_ampm_time(
-                                    section_data.get("tue_end_time")
-                                ),
-                                "wednesday_start_time": Command.parse_ampm_time(
-                                    section_data.get("wed_start_time")
-                                ),
-                                "wednesday_end_time": Command.parse_ampm_time(
-                                    section_data.get("wed_end_time")
-                                ),
-                                "thursday_start_time": Command.parse_ampm_time(
-                                    section_data.get("thu_start_time")
-                                ),
-                                "thursday_end_time": Command.parse_ampm_time(
-                                    section_data.get("thu_end_time")
-                                ),
-                                "friday_start_time": Command.parse_ampm_time(
-                                    section_data.get("fri_start_time")
-                                ),
-                                "friday_end_time": Command.parse_ampm_time(
-                                    section_data.get("fri_end_time")
-                                ),
-                                "saturday_start_time": Command.parse_ampm_time(
-                                    section_data.get("sat_start_time")
-                                ),
-                                "saturday_end_time": Command.parse_ampm_time(
-                                    section_data.get("sat_end_time")
-                                ),
-                                "sunday_start_time": Command.parse_ampm_time(
-                                    section_data.get("sun_start_time")
-                                ),
-                                "sunday_end_time": Command.parse_ampm_time(
-                                    section_data.get("sun_end_time")
-                                ),
-                                "professor": sectionProfessor,
-                                "location": section_data.get(
-                                    "course_location", "Unknown Location"
-                                ),
-                            },
-                        )
-                        sections.append(section)
-                        professors.append(sectionProfessor)
-                        i += 1
 
-                    course.professors.set(professors)
-                    course.courseMaterialsLink = courseMaterialsLink
-                    course.save()
+                        # Loader state is only updated once everything that can
+                        # fail for this course has succeeded, so a failure
+                        # leaves nothing behind
+                        for field, value in prepared["course_fields"].items():
+                            setattr(course, field, value)
+                        course.placement_course = placementCourse
+                        course.source_hash = course_hashes.get(id, "")
 
-                    if course.sections.all().count() == 0:
-                        dummy_professor, _ = Professor.objects.get_or_create(
-                            name="TBA", link=INSTITUTIONAL_DOMAIN
-                        )
-                        dummy_section, _ = Section.objects.update_or_create(
-                            section_number="01",
-                            section_for=course,
-                            defaults={"professor": dummy_professor, "location": "TBA"},
-                        )
-                        course.professors.add(dummy_professor)
-                        course.save()
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f'Added dummy section for course "{course.courseName}"'
+                        # Generate AI summary once per course if missing
+                        if not course.summary:
+                            summary_text = Command.generate_course_summary(
+                                course.courseName,
+                                course.courseDescription,
                             )
-                        )
+                            if summary_text:
+                                course.summary = summary_text
 
-                    self.stdout.write(
-                        self.style.SUCCESS(
-                            f'Successfully created course "{course.courseName}"'
-                        )
-                    )
+                        courses_to_save[id] = course
 
-                except Exception as e:
-                    if options.get("skip_bad_records", False):
-                        skipped_records += 1
-                        self.stdout.write(
-                            self.style.WARNING(
-                                f"Skipping malformed course record due to error: {str(e)} for {course_data}"
+                        for section in sections:
+                            key = (id, section.section_number)
+                            sections_to_save[key] = section
+                            dummy_sections.pop(key, None)
+                        if needs_dummy:
+                            dummy_sections[(id, "01")] = Section(
+                                section_number="01",
+                                section_for=course,
+                                professor=dummy_professor,
+                                location="TBA",
                             )
-                        )
-                        continue
+                        if sections:
+                            courses_with_sections.add(id)
 
-                    self.stdout.write(
-                        self.style.ERROR(
-                            f"Failed to create course: {str(e)} for {course_data}"
-                        )
-                    )
-                    raise
+                        related = {
+                            "courseCodes": codes,
+                            "departments": departments,
+                            "corequisites": corequisites,
+                            **term_offerings,
+                            "divisions": divisions,
+                            "keywords": keywords,
+                            "recommended_courses": recommended,
+                        }
+                        for field, objs in related.items():
+                            m2m_assignments[field].append(
+                                (id, [obj.pk for obj in objs])
+                            )
+
+                        for reqSet in prepared["required"]:
+                            courses = [course_by_id[req] for req in reqSet]
+                            prereq_sets.setdefault(
+                                (id, frozenset(c.id for c in courses)),
+                                (PrerequisiteSet(prerequisite_for=course), courses),
+                            )
+
+                        # Professors follow the sections, so they are kept when
+                        # the existing sections are
+                        if professors:
+                            m2m_assignments["professors"].append(
+                                (id, [professor.pk for professor in professors])
+                            )
+
+                        loaded += 1
+                        if verbose:
+                            log_lines.append(
+                                self.style.SUCCESS(
+                                    f'Successfully created course "{course.courseName}"'
+                                )
+                            )
+                        elif loaded % PROGRESS_INTERVAL == 0:
+                            log_lines.append(f"{loaded} courses loaded...")
+
+                    except Exception as e:
+                        # Nothing is written while a course is prepared, so
+                        # the courses around it are still loaded
+                        reject(course_data, str(e))
+
+        flush_log()
+
+        write_batch()
+
+        if errors:
+            self.stdout.write(self.style.ERROR("\n".join(errors)))
+
+        self.stdout.write(self.style.SUCCESS(f"Loaded {loaded} course record(s)."))
+
+        if unchanged_ids:
+            self.stdout.write(
+                f"{len(unchanged_ids)} unchanged course(s) skipped; use --force to reload them."
+            )
+
+        if failed_records:
+            self.stdout.write(
+                self.style.ERROR(
+                    f"Completed with {failed_records} course record(s) that failed to load."
+                )
+            )
 
         if skipped_records:
             self.stdout.write(
@@ -618,3 +1477,20 @@ class Command(BaseCommand):
                     f"Completed with {skipped_records} skipped malformed course record(s)."
                 )
             )
+
+        # Store the search similarity index so searches don't build it
+        try:
+            index_path = save_search_index()
+        except OSError as e:
+            self.stdout.write(self.style.WARNING(f"Could not save search index: {e}"))
+        else:
+            if index_path:
+                self.stdout.write(f"Saved search index to {index_path}.")
+
+        # Loaded batches stay committed; the command still fails so callers
+        # (and CI) notice the records that did not load
+        if failed_records:
+            raise CommandError(
+                f"{failed_records} course record(s) failed to load; "
+                "use --skip-bad-records to skip malformed records"
+            )
@@ -49,7 +49,7 @@ Example Output Format::
     }
 
 Dependencies:
-    - BeautifulSoup4 for HTML parsing
+    - selectolax for HTML parsing
     - Requests for HTTP requests
 """
 
@@ -62,10 +62,10 @@ import logging
 from amherst_coursework_algo.parse_course_catalogue.parse_course_catalogue import (
     parse_all_courses,
     DATA_DIR,
+    MAX_CONCURRENT_REQUESTS,
+    REQUEST_DELAY,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -83,6 +83,21 @@ class Command(BaseCommand):
 
     help = "Parse courses (first degree) from list of all courses in departments"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=MAX_CONCURRENT_REQUESTS,
+            help=f"Number of course pages fetched concurrently (default {MAX_CONCURRENT_REQUESTS}); "
+            f"requests still start {REQUEST_DELAY}s apart, so more workers only "
+            "overlap waiting on the server",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="Fetch every page from the server instead of the local HTTP cache",
+        )
+
     def handle(self, *args, **options):
         """Execute the command to parse first-degree course information.
 
@@ -98,13 +113,20 @@ class Command(BaseCommand):
             Starting step 2: Parsing courses (first degree)...
             Successfully completed step 2!
         """
+        # Configure logging
+        logging.basicConfig(level=logging.INFO)
+
         try:
             # Create data directory if it doesn't exist
             os.makedirs(DATA_DIR, exist_ok=True)
 
             # Step 2: Parse all courses first degree
             logger.info("Starting step 2: Parsing courses (first degree)...")
-            parsed_courses = parse_all_courses(testing_mode=False)
+            parsed_courses = parse_all_courses(
+                testing_mode=False,
+                max_concurrency=options["workers"],
+                use_cache=not options["no_cache"],
+            )
             if not parsed_courses:
                 raise Exception("Failed to parse courses (first degree)")
             logger.info("Successfully completed step 2!")
@@ -7,20 +7,32 @@ Amherst College course catalog. It executes the second degree of parsing, which
 and structures additional details like section times, locations, and professor assignments.
 
 This command should be run after parse_deg_1 to enhance the initially parsed course data.
+With --fused it instead fetches the course pages itself and runs both degrees in one
+pass, without writing or reading parsed_courses_detailed.json.
 
 Example:
     To run this command::
 
         $ python manage.py parse_deg_2
 
+    Or, right after get_all_department_courses::
+
+        $ python manage.py parse_deg_2 --fused
+
 File Dependencies:
     Input:
         - parsed_courses_detailed.json:
             Contains basic course information from first degree parsing
+        - all_department_courses.json:
+            Course URLs by department (--fused only)
 
     Output:
         - parsed_courses_second_deg.json:
             Contains enhanced course information with structured section data
+        - parsed_courses_second_deg.ndjson:
+            The same courses as newline-delimited JSON, one per line with a
+            "dept" key; load_courses reads it line by line. Local only: it
+            is not committed, and the workflows load the JSON file
 
 Example Output Format::
 
@@ -52,7 +64,7 @@ Example Output Format::
     }
 
 Dependencies:
-    - BeautifulSoup4 for HTML parsing
+    - selectolax for HTML parsing
     - JSON for data handling
 """
 
@@ -63,12 +75,13 @@ import json
 import logging
 
 from amherst_coursework_algo.parse_course_catalogue.parse_course_catalogue import (
+    parse_all_courses_fused,
     parse_all_courses_second_deg,
     DATA_DIR,
+    MAX_CONCURRENT_REQUESTS,
+    REQUEST_DELAY,
 )
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 
@@ -88,6 +101,26 @@ class Command(BaseCommand):
 
     help = "Parse courses (second degree) from list of all courses in departments"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--fused",
+            action="store_true",
+            help="Fetch the course pages and run both parsing degrees in one pass",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=MAX_CONCURRENT_REQUESTS,
+            help=f"Number of course pages fetched concurrently with --fused (default {MAX_CONCURRENT_REQUESTS}); "
+            f"requests still start {REQUEST_DELAY}s apart, so more workers only "
+            "overlap waiting on the server",
+        )
+        parser.add_argument(
+            "--no-cache",
+            action="store_true",
+            help="With --fused, fetch every page from the server instead of the local HTTP cache",
+        )
+
     def handle(self, *args, **options):
         """Execute the command to parse second-degree course information.
 
@@ -103,13 +136,22 @@ class Command(BaseCommand):
             Starting step 3: Parsing courses (second degree)...
             Successfully completed step 3!
         """
+        # Configure logging
+        logging.basicConfig(level=logging.INFO)
+
         try:
             # Create data directory if it doesn't exist
             os.makedirs(DATA_DIR, exist_ok=True)
 
             # Step 3: Parse all courses second degree
             logger.info("Starting step 3: Parsing courses (second degree)...")
-            enhanced_courses = parse_all_courses_second_deg()
+            if options["fused"]:
+                enhanced_courses = parse_all_courses_fused(
+                    max_concurrency=options["workers"],
+                    use_cache=not options["no_cache"],
+                )
+            else:
+                enhanced_courses = parse_all_courses_second_deg()
             if not enhanced_courses:
                 raise Exception("Failed to parse courses (second degree)")
             logger.info("Successfully completed step 3!")
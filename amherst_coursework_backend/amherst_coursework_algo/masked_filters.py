@@ -32,18 +32,23 @@ The module provides the following main functions:
 - restore_dept_code : Normalizes department codes
 - restore_course_code : Formats course codes
 - prepare_course_text : Prepares course text for similarity search
+- build_similarity_index : Counts document terms once for reuse across queries
+- save_search_index : Stores the course similarity index next to the database
 - compute_similarity_scores : Calculates similarity between texts
 - clean_query : Processes and tokenizes search queries
 - filter : Main filtering and ranking function
 """
 
 from .models import Course
-from sklearn.metrics.pairwise import cosine_similarity
-from sklearn.feature_extraction.text import TfidfVectorizer
-from typing import List
-from django.db.models import Q
-import nltk
-from nltk.corpus import stopwords
+import hashlib
+import math
+import os
+import pickle
+import re
+import string
+from collections import Counter, defaultdict
+from functools import lru_cache, partial
+from typing import List, Optional, Tuple
 
 courses = []
 
@@ -127,17 +132,78 @@ KEYWORD_SYNONYMS = {
     "movies": ["film", "cinema"],
 }
 
-# Initialize stopwords for English
-try:
-    stop_words = set(stopwords.words("english"))
-except LookupError as e:
+# Whole-word patterns for each abbreviation and its expansion, compiled once
+ABBREVIATION_PATTERNS = [
+    (
+        abbr,
+        full,
+        re.compile(r"\b" + re.escape(abbr) + r"\b", re.IGNORECASE),
+        re.compile(r"\b" + re.escape(full) + r"\b", re.IGNORECASE),
+    )
+    for abbr, full in ABBREVIATION_MAP.items()
+]
+
+# Whole-word pattern for each synonym keyword, with its synonyms joined
+SYNONYM_PATTERNS = [
+    (
+        keyword,
+        " ".join(synonyms),
+        re.compile(r"\b" + re.escape(keyword) + r"\b", re.IGNORECASE),
+    )
+    for keyword, synonyms in KEYWORD_SYNONYMS.items()
+]
+
+# One scan for any abbreviation / full term / synonym keyword, so text with
+# none of them skips the per-entry substitutions entirely
+ANY_ABBREVIATION_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, ABBREVIATION_MAP)) + r")\b", re.IGNORECASE
+)
+ANY_FULL_TERM_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, ABBREVIATION_MAP.values())) + r")\b",
+    re.IGNORECASE,
+)
+ANY_SYNONYM_PATTERN = re.compile(
+    r"\b(?:" + "|".join(map(re.escape, KEYWORD_SYNONYMS)) + r")\b", re.IGNORECASE
+)
+
+DEPT_CODE_PATTERN = re.compile(r"^([a-zA-Z]+)")
+COURSE_CODE_PATTERN = re.compile(r"([a-zA-Z]+)(\d+)")
+# Search terms shaped like course codes (e.g., "COSC-207", "math111")
+COURSE_CODE_TERM_PATTERN = re.compile(r"^[A-Z]{4}-?\d+[A-Z]?$", re.IGNORECASE)
+# sklearn's default token pattern, so similarity tokens match TfidfVectorizer's
+SIMILARITY_TOKEN_PATTERN = re.compile(r"(?u)\b\w\w+\b")
+
+# ASCII-only case folding, as SQLite's case-insensitive LIKE does
+ASCII_LOWERCASE_TABLE = str.maketrans(string.ascii_uppercase, string.ascii_lowercase)
+# Half-credit course IDs have a 1 as their fourth digit
+HALF_COURSE_ID_PATTERN = re.compile(r"^.{3}1")
+
+SEARCH_INDEX_SUFFIX = ".search_index.pkl"
+"""Suffix of the stored course similarity index, kept next to the SQLite database"""
+
+
+@lru_cache(maxsize=None)
+def _get_stopwords() -> frozenset:
+    """
+    Load NLTK's English stop words on first use.
+
+    NLTK is imported and its stop word corpus read (or downloaded, if it is
+    missing) only once a search needs them, rather than whenever Django loads
+    the URLconf.
+    """
+    import nltk
+    from nltk.corpus import stopwords
+
     try:
-        nltk.download("stopwords")
-        stop_words = set(stopwords.words("english"))
-    except Exception as download_error:
-        raise RuntimeError(
-            f"Failed to initialize stopwords: {str(e)}. Download attempt failed: {str(download_error)}"
-        )
+        return frozenset(stopwords.words("english"))
+    except LookupError as e:
+        try:
+            nltk.download("stopwords")
+            return frozenset(stopwords.words("english"))
+        except Exception as download_error:
+            raise RuntimeError(
+                f"Failed to initialize stopwords: {str(e)}. Download attempt failed: {str(download_error)}"
+            )
 
 
 # =============================================================================
@@ -172,10 +238,8 @@ def restore_dept_code(code: str) -> str:
     >>> restore_dept_code('123')
     'XXXXX'
     """
-    import re
-
     # Get only letters from start of string
-    match = re.match(r"^([a-zA-Z]+)", code)
+    match = DEPT_CODE_PATTERN.match(code)
     if not match:
         return "XXXXX"
 
@@ -207,9 +271,7 @@ def restore_course_code(code: str) -> str:
     >>> restore_course_code('invalid')
     'invalid'
     """
-    import re
-
-    match = re.match(r"([a-zA-Z]+)(\d+)", code)
+    match = COURSE_CODE_PATTERN.match(code)
     if not match:
         return code
 
@@ -247,6 +309,206 @@ def prepare_course_text(course) -> str:
     ).lower()
 
 
+def course_similarity_texts(courses) -> List[str]:
+    """
+    Build the abbreviation-expanded text of each course for similarity search.
+
+    Parameters
+    ----------
+    courses : QuerySet
+        Courses with departments, professors and keywords prefetched
+
+    Returns
+    -------
+    List[str]
+        One text per course, in the order of ``courses``
+    """
+    return [expand_abbreviations(prepare_course_text(course)) for course in courses]
+
+
+def analyze_similarity_text(text: str, stop_words: frozenset) -> List[str]:
+    """
+    Tokenize text the way ``TfidfVectorizer(stop_words="english")`` does.
+
+    Parameters
+    ----------
+    text : str
+        Text to tokenize
+    stop_words : frozenset
+        Tokens to drop (sklearn's English stop words)
+
+    Returns
+    -------
+    List[str]
+        Lowercased tokens of two or more word characters, stop words removed
+    """
+    return [
+        token
+        for token in SIMILARITY_TOKEN_PATTERN.findall(text.lower())
+        if token not in stop_words
+    ]
+
+
+def similarity_fingerprint(information: Tuple[str, ...]) -> str:
+    """Return a hash identifying a corpus of documents, in order."""
+    digest = hashlib.sha256()
+    for text in information:
+        digest.update(text.encode())
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def search_index_path() -> Optional[str]:
+    """
+    Return where the course similarity index is stored.
+
+    Returns
+    -------
+    Optional[str]
+        A file next to the SQLite database, or None if the database is not a
+        file (e.g. the in-memory test database)
+    """
+    from django.db import connection
+
+    if connection.vendor != "sqlite" or connection.is_in_memory_db():
+        return None
+    name = os.fspath(connection.settings_dict["NAME"])
+    return os.path.splitext(name)[0] + SEARCH_INDEX_SUFFIX
+
+
+def fit_similarity_index(information: Tuple[str, ...]) -> dict:
+    """
+    Count the terms of each document.
+
+    Parameters
+    ----------
+    information : Tuple[str, ...]
+        Documents to index
+
+    Returns
+    -------
+    dict
+        ``stop_words``, ``vocabulary`` (term -> column), ``counts`` (sparse
+        CSC document-term counts) and ``doc_freq`` (documents per term)
+    """
+    import numpy as np
+    from scipy.sparse import csc_matrix
+    from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS, CountVectorizer
+
+    vectorizer = CountVectorizer(
+        analyzer=partial(analyze_similarity_text, stop_words=ENGLISH_STOP_WORDS),
+        dtype=np.float64,
+    )
+    try:
+        counts = vectorizer.fit_transform(information).tocsc()
+        vocabulary = vectorizer.vocabulary_
+    except ValueError:
+        # No document has a single indexable term
+        counts = csc_matrix((len(information), 0), dtype=np.float64)
+        vocabulary = {}
+    return {
+        "stop_words": ENGLISH_STOP_WORDS,
+        "vocabulary": vocabulary,
+        "counts": counts,
+        "doc_freq": np.diff(counts.indptr).astype(np.float64),
+    }
+
+
+def read_search_index(information: Tuple[str, ...]) -> Optional[dict]:
+    """
+    Load the stored similarity index if it was built from these documents.
+
+    Parameters
+    ----------
+    information : Tuple[str, ...]
+        Documents being searched
+
+    Returns
+    -------
+    Optional[dict]
+        The stored index (see ``fit_similarity_index``), or None if there is
+        none or it was built from other course data
+    """
+    path = search_index_path()
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path, "rb") as f:
+            stored = pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        return None
+    if stored.get("fingerprint") != similarity_fingerprint(information):
+        return None
+    return stored
+
+
+def save_search_index() -> Optional[str]:
+    """
+    Build the similarity index over all courses and store it for searches.
+
+    Returns
+    -------
+    Optional[str]
+        Path of the stored index, or None if the database is not a file
+
+    Notes
+    -----
+    Called by ``load_courses`` so the first search after a load or a server
+    start neither imports sklearn nor counts terms. The index carries a
+    fingerprint of the course texts and is ignored once they change
+    """
+    path = search_index_path()
+    if path is None:
+        return None
+    # Same query shape as filter(), so the courses come back in its order
+    courses = Course.objects.filter(
+        id__in=list(Course.objects.values_list("id", flat=True))
+    ).prefetch_related("departments", "keywords", "professors")
+    information = tuple(course_similarity_texts(courses))
+    index = fit_similarity_index(information)
+    index["fingerprint"] = similarity_fingerprint(information)
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    with open(tmp_path, "wb") as f:
+        pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, path)
+    return path
+
+
+@lru_cache(maxsize=8)
+def build_similarity_index(information: Tuple[str, ...]) -> tuple:
+    """
+    Count the terms of each document once so queries can reuse them.
+
+    Parameters
+    ----------
+    information : Tuple[str, ...]
+        Documents to index; a tuple so the index is cached per corpus
+
+    Returns
+    -------
+    tuple
+        ``(analyzer, vocabulary, counts, squared_counts, doc_freq)``: the
+        TF-IDF tokenizer, a term -> column mapping, the sparse document-term
+        count matrix and its element-wise square (CSC), and the number of
+        documents containing each term
+
+    Notes
+    -----
+    The index is keyed by the document texts themselves, so changed course
+    data simply produces a new index. The one stored by
+    ``save_search_index`` is used when it matches the documents
+    """
+    index = read_search_index(information) or fit_similarity_index(information)
+    counts = index["counts"]
+    return (
+        partial(analyze_similarity_text, stop_words=index["stop_words"]),
+        index["vocabulary"],
+        counts,
+        counts.multiply(counts).tocsc(),
+        index["doc_freq"],
+    )
+
+
 def compute_similarity_scores(query: str, information: List[str]) -> List[float]:
     """
     Compute TF-IDF cosine similarity scores between a query and a list of information.
@@ -270,6 +532,11 @@ def compute_similarity_scores(query: str, information: List[str]) -> List[float]
     - Removes English stop words before computation
     - Returns list of zeros if query or information is empty
     - DOES NOT compare semantic similarity of text, only lexical similarity
+    - The scores equal fitting ``TfidfVectorizer(stop_words="english")`` on
+      the query plus the information and taking the cosine similarity, but
+      only the query is tokenized per call: document term counts come from
+      ``build_similarity_index``, and the query's effect on the smoothed IDF
+      (one more document, containing the query terms) is applied to them
 
     Examples
     --------
@@ -280,25 +547,50 @@ def compute_similarity_scores(query: str, information: List[str]) -> List[float]
     if not query or not information:
         return [0] * len(information)
 
-    # Initialize TF-IDF vectorizer
-    vectorizer = TfidfVectorizer(stop_words="english")
-
-    # Combine query and information for vectorization
-    all_texts = [query] + information
+    # numpy/scipy (and sklearn, without a stored index) are only imported
+    # once a search needs them
+    import numpy as np
 
-    # Create TF-IDF matrix
-    tfidf_matrix = vectorizer.fit_transform(all_texts)
+    analyzer, vocabulary, counts, squared_counts, doc_freq = build_similarity_index(
+        tuple(information)
+    )
+    query_counts = Counter(analyzer(query))
+    columns = [vocabulary[term] for term in query_counts if term in vocabulary]
+    query_tf = np.array(
+        [query_counts[term] for term in query_counts if term in vocabulary],
+        dtype=np.float64,
+    )
 
-    # Compute cosine similarity between query and each title
-    similarities = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:])
+    # Smoothed IDF over the documents plus the query, as a fit on both would
+    num_docs = len(information) + 1
+    doc_freq = doc_freq.copy()
+    doc_freq[columns] += 1
+    idf = np.log((1 + num_docs) / (1 + doc_freq)) + 1
+    # Query terms that appear in no document occur only in the query itself
+    unseen_idf = math.log((1 + num_docs) / 2) + 1
+    unseen_weight = sum(
+        (count * unseen_idf) ** 2
+        for term, count in query_counts.items()
+        if term not in vocabulary
+    )
+    query_norm = math.sqrt(
+        float(((query_tf * idf[columns]) ** 2).sum()) + unseen_weight
+    )
+    doc_norms = np.sqrt(squared_counts @ (idf**2))
 
-    return similarities[0]
+    similarities = np.zeros(len(information))
+    if query_norm and columns:
+        dots = counts[:, columns] @ (query_tf * idf[columns] ** 2)
+        np.divide(dots, doc_norms * query_norm, out=similarities, where=doc_norms > 0)
+    return similarities
 
 
+@lru_cache(maxsize=4096)
 def expand_abbreviations(text: str) -> str:
     """
     Expand common abbreviations in text for better semantic matching.
     Works bidirectionally: expands abbreviations AND adds abbreviations for full terms.
+    Results are memoized, since every search expands the same course texts.
 
     Parameters
     ----------
@@ -317,25 +609,24 @@ def expand_abbreviations(text: str) -> str:
     >>> expand_abbreviations("artificial intelligence course")
     "artificial intelligence AI course"
     """
-    import re
-
     expanded = text
 
     # First pass: expand abbreviations to full terms
-    for abbr, full in ABBREVIATION_MAP.items():
-        # Match abbreviation as whole word (case-insensitive)
-        pattern = r"\b" + re.escape(abbr) + r"\b"
-        if re.search(pattern, text, re.IGNORECASE):
-            # Add expanded form after the abbreviation
-            expanded = re.sub(pattern, f"{abbr} {full}", expanded, flags=re.IGNORECASE)
+    if ANY_ABBREVIATION_PATTERN.search(text):
+        for abbr, full, abbr_pattern, _ in ABBREVIATION_PATTERNS:
+            # Match abbreviation as whole word (case-insensitive)
+            if abbr_pattern.search(text):
+                # Add expanded form after the abbreviation
+                expanded = abbr_pattern.sub(f"{abbr} {full}", expanded)
 
     # Second pass: add abbreviations for full terms
-    for abbr, full in ABBREVIATION_MAP.items():
+    if not ANY_FULL_TERM_PATTERN.search(expanded):
+        return expanded
+    for abbr, full, _, full_pattern in ABBREVIATION_PATTERNS:
         # Match full term (case-insensitive)
-        pattern = r"\b" + re.escape(full) + r"\b"
-        if re.search(pattern, expanded, re.IGNORECASE):
+        if full_pattern.search(expanded):
             # Add abbreviation after the full term
-            expanded = re.sub(pattern, f"{full} {abbr}", expanded, flags=re.IGNORECASE)
+            expanded = full_pattern.sub(f"{full} {abbr}", expanded)
 
     return expanded
 
@@ -359,20 +650,16 @@ def expand_synonyms(text: str) -> str:
     >>> expand_synonyms("I want to learn coding")
     "I want to learn coding programming computer science software"
     """
-    import re
-
     expanded = text
     text_lower = text.lower()
+    if not ANY_SYNONYM_PATTERN.search(text_lower):
+        return expanded
 
     # Add synonyms for matching keywords
-    for keyword, synonyms in KEYWORD_SYNONYMS.items():
-        pattern = r"\b" + re.escape(keyword) + r"\b"
-        if re.search(pattern, text_lower):
+    for keyword, synonym_text, pattern in SYNONYM_PATTERNS:
+        if pattern.search(text_lower):
             # Add synonyms after the keyword
-            synonym_text = " ".join(synonyms)
-            expanded = re.sub(
-                pattern, f"{keyword} {synonym_text}", expanded, flags=re.IGNORECASE
-            )
+            expanded = pattern.sub(f"{keyword} {synonym_text}", expanded)
 
     return expanded
 
@@ -398,21 +685,22 @@ def detect_phrases(query: str) -> List[str]:
     """
     words = query.lower().split()
     phrases = []
+    stop_words = _get_stopwords()
 
     # Look for 2-word phrases
-    for i in range(len(words) - 1):
-        if words[i] not in stop_words and words[i + 1] not in stop_words:
-            phrases.append(f"{words[i]} {words[i+1]}")
+    for first, second in zip(words, words[1:]):
+        if first not in stop_words and second not in stop_words:
+            phrases.append(f"{first} {second}")
 
     # Look for 3-word phrases (skip middle word if it's a stopword)
-    for i in range(len(words) - 2):
-        if words[i] not in stop_words and words[i + 2] not in stop_words:
-            if words[i + 1] in stop_words:
+    for first, middle, last in zip(words, words[1:], words[2:]):
+        if first not in stop_words and last not in stop_words:
+            if middle in stop_words:
                 # e.g., "artificial [and] intelligence"
-                phrases.append(f"{words[i]} {words[i+2]}")
+                phrases.append(f"{first} {last}")
             else:
                 # e.g., "machine learning algorithms"
-                phrases.append(f"{words[i]} {words[i+1]} {words[i+2]}")
+                phrases.append(f"{first} {middle} {last}")
 
     return phrases
 
@@ -436,6 +724,7 @@ def clean_query(query: str) -> List[str]:
     -----
     Uses NLTK's English stop words list for filtering
     """
+    stop_words = _get_stopwords()
     return [
         word.lower()
         for word in query.split()
@@ -443,8 +732,66 @@ def clean_query(query: str) -> List[str]:
     ]
 
 
+@lru_cache(maxsize=512)
+def word_boundary_pattern(term: str) -> re.Pattern:
+    """Return a compiled case-insensitive ``\\b<term>\\b`` pattern."""
+    return re.compile(r"(?i)\b" + re.escape(term) + r"\b")
+
+
+def build_term_match_rows(filtered_courses) -> List[tuple]:
+    """
+    Collect the fields ``score_term_matches`` searches, once per search.
+
+    Parameters
+    ----------
+    filtered_courses : QuerySet
+        Django QuerySet of courses to search, with ``departments``,
+        ``divisions``, ``keywords`` and ``professors`` prefetched
+
+    Returns
+    -------
+    List[tuple]
+        ``(course, name, description, related)`` per course. ``name`` and
+        ``description`` (None if missing) and each value in ``related`` (a
+        tuple of ``(weight, values)``) are ``(text, ascii_lowercase_text)``
+        pairs. Related fields hold one value per related row, so a course
+        matching two departments scores twice, as the joined queries did
+    """
+
+    def values(texts):
+        return tuple(
+            (text, text.translate(ASCII_LOWERCASE_TABLE))
+            for text in texts
+            if text is not None
+        )
+
+    rows = []
+    for course in filtered_courses:
+        name = values([course.courseName])
+        description = values([course.courseDescription])
+        related = (
+            (DEPARTMENT_NAME_WEIGHT, values(d.name for d in course.departments.all())),
+            (DIVISION_WEIGHT, values(d.name for d in course.divisions.all())),
+            (KEYWORD_WEIGHT, values(k.name for k in course.keywords.all())),
+            (PROFESSOR_WEIGHT, values(p.name for p in course.professors.all())),
+        )
+        rows.append(
+            (
+                course,
+                name[0] if name else None,
+                description[0] if description else None,
+                related,
+            )
+        )
+    return rows
+
+
 def score_term_matches(
-    term: str, filtered_courses, scores: dict, use_word_boundary: bool = False
+    term: str,
+    filtered_courses,
+    scores: dict,
+    use_word_boundary: bool = False,
+    rows: List[tuple] = None,
 ) -> None:
     """
     Score courses based on term matches across different fields.
@@ -459,52 +806,80 @@ def score_term_matches(
         Dictionary mapping course IDs to scores (modified in place)
     use_word_boundary : bool
         If True, use word boundary matching for precise matches
+    rows : List[tuple], optional
+        Course fields from ``build_term_match_rows``; built from
+        ``filtered_courses`` when omitted
+
+    Notes
+    -----
+    Matching happens in Python over the prefetched fields, with the same
+    semantics as the ``__icontains`` (ASCII-only case folding) and
+    ``__iregex`` lookups it replaces
     """
-    import re
+    if rows is None:
+        rows = build_term_match_rows(filtered_courses)
 
     # Determine matching strategy
     if use_word_boundary:
-        word_pattern = r"\b" + re.escape(term) + r"\b"
-        match_filter = lambda field: {f"{field}__iregex": word_pattern}
+        search = word_boundary_pattern(term).search
+        matches = lambda value: search(value[0]) is not None
     else:
-        match_filter = lambda field: {f"{field}__icontains": term}
+        folded_term = term.translate(ASCII_LOWERCASE_TABLE)
+        matches = lambda value: folded_term in value[1]
 
-    # Score course name matches
-    name_matches = filtered_courses.filter(**match_filter("courseName"))
-    for course in name_matches:
-        scores[course.id] += COURSE_NAME_WEIGHT
-        # Bonus for exact word match
-        course_words = course.courseName.lower().split()
-        if term in course_words:
-            scores[course.id] += COURSE_NAME_EXACT_WEIGHT
+    for course, name, description, related in rows:
+        # Score course name matches
+        if name is not None and matches(name):
+            scores[course.id] += COURSE_NAME_WEIGHT
+            # Bonus for exact word match
+            if term in course.courseName.lower().split():
+                scores[course.id] += COURSE_NAME_EXACT_WEIGHT
 
-    # Score department name matches
-    dept_matches = filtered_courses.filter(**match_filter("departments__name"))
-    for course in dept_matches:
-        scores[course.id] += DEPARTMENT_NAME_WEIGHT
+        # Score description matches
+        if description is not None and matches(description):
+            scores[course.id] += DESCRIPTION_WEIGHT
 
-    # Score division matches
-    div_matches = filtered_courses.filter(**match_filter("divisions__name"))
-    for course in div_matches:
-        scores[course.id] += DIVISION_WEIGHT
+        # Score department, division, keyword and professor matches
+        for weight, field_values in related:
+            for value in field_values:
+                if matches(value):
+                    scores[course.id] += weight
 
-    # Score keyword matches
-    keyword_matches = filtered_courses.filter(**match_filter("keywords__name"))
-    for course in keyword_matches:
-        scores[course.id] += KEYWORD_WEIGHT
 
-    # Score description matches
-    desc_matches = filtered_courses.filter(**match_filter("courseDescription"))
-    for course in desc_matches:
-        scores[course.id] += DESCRIPTION_WEIGHT
+def build_code_index(filtered_courses) -> Tuple[dict, dict]:
+    """
+    Build exact-match lookup tables for course and department codes.
 
-    # Score professor matches
-    prof_matches = filtered_courses.filter(**match_filter("professors__name"))
-    for course in prof_matches:
-        scores[course.id] += PROFESSOR_WEIGHT
+    Parameters
+    ----------
+    filtered_courses : QuerySet
+        Django QuerySet of courses to search, with ``courseCodes`` and
+        ``departments`` prefetched
+
+    Returns
+    -------
+    Tuple[dict, dict]
+        ``(course_code_index, dept_code_index)``: uppercased course code ->
+        set of course IDs, and uppercased department code -> list of course
+        IDs with one entry per matching department (as a join would return)
+
+    Notes
+    -----
+    Built once per search so each term costs a dict probe rather than a query
+    """
+    course_code_index = defaultdict(set)
+    dept_code_index = defaultdict(list)
+    for course in filtered_courses:
+        for code in course.courseCodes.all():
+            course_code_index[code.value.upper()].add(course.id)
+        for dept in course.departments.all():
+            dept_code_index[dept.code.upper()].append(course.id)
+    return course_code_index, dept_code_index
 
 
-def score_course_codes(term: str, filtered_courses, scores: dict) -> None:
+def score_course_codes(
+    term: str, filtered_courses, scores: dict, code_index: tuple = None
+) -> None:
     """
     Score courses based on course code matches.
 
@@ -516,29 +891,38 @@ def score_course_codes(term: str, filtered_courses, scores: dict) -> None:
         Django QuerySet of courses to search
     scores : dict
         Dictionary mapping course IDs to scores (modified in place)
+    code_index : tuple, optional
+        Lookup tables from ``build_code_index``; built from
+        ``filtered_courses`` when omitted
     """
-    # Match course codes with partial and formatted matches
-    code_matches = filtered_courses.filter(
-        Q(courseCodes__value__icontains=term)
-        | Q(courseCodes__value__iregex=restore_course_code(term))
-    )
-    for course in code_matches.distinct():
-        scores[course.id] += COURSE_CODE_WEIGHT
-        # Bonus for exact course code match
-        for code in course.courseCodes.all():
-            if code.value.upper() == term.upper():
+    if code_index is None:
+        code_index = build_code_index(filtered_courses)
+    course_code_index, dept_code_index = code_index
+    exact_code_matches = course_code_index.get(term.upper(), ())
+
+    # Match course codes with partial and formatted matches (the formatted
+    # code is used as a case-insensitive regex, as the __iregex lookup did)
+    folded_term = term.translate(ASCII_LOWERCASE_TABLE)
+    formatted_search = re.compile("(?i)" + restore_course_code(term)).search
+    for course in filtered_courses:
+        if any(
+            folded_term in code.value.translate(ASCII_LOWERCASE_TABLE)
+            or formatted_search(code.value)
+            for code in course.courseCodes.all()
+        ):
+            scores[course.id] += COURSE_CODE_WEIGHT
+            # Bonus for exact course code match
+            if course.id in exact_code_matches:
                 scores[course.id] += COURSE_CODE_EXACT_WEIGHT
-                break
 
     # Match department codes
-    dept_code_matches = filtered_courses.filter(
-        departments__code__iexact=restore_dept_code(term)
-    )
-    for course in dept_code_matches:
-        scores[course.id] += DEPARTMENT_CODE_WEIGHT
+    for course_id in dept_code_index.get(restore_dept_code(term), ()):
+        scores[course_id] += DEPARTMENT_CODE_WEIGHT
 
 
-def score_phrase_matches(phrases: List[str], filtered_courses, scores: dict) -> None:
+def score_phrase_matches(
+    phrases: List[str], filtered_courses, scores: dict, rows: List[tuple] = None
+) -> None:
     """
     Score courses based on multi-word phrase matches.
 
@@ -550,29 +934,32 @@ def score_phrase_matches(phrases: List[str], filtered_courses, scores: dict) ->
         Django QuerySet of courses to search
     scores : dict
         Dictionary mapping course IDs to scores (modified in place)
+    rows : List[tuple], optional
+        Course fields from ``build_term_match_rows``; built from
+        ``filtered_courses`` when omitted
     """
+    if not phrases:
+        return
+    if rows is None:
+        rows = build_term_match_rows(filtered_courses)
+
     for phrase in phrases:
         # Expand abbreviations in phrases
         expanded_phrase = expand_abbreviations(phrase)
 
-        # Check original phrase in name and description
-        for course in filtered_courses.filter(courseName__icontains=phrase):
-            scores[course.id] += PHRASE_MATCH_WEIGHT
-
-        for course in filtered_courses.filter(courseDescription__icontains=phrase):
-            scores[course.id] += PHRASE_MATCH_WEIGHT
-
-        # Check expanded phrase if different
+        # Check original phrase in name and description, then the expanded
+        # phrase if different
+        candidates = [phrase]
         if expanded_phrase != phrase:
-            for course in filtered_courses.filter(
-                courseName__icontains=expanded_phrase
-            ):
-                scores[course.id] += PHRASE_MATCH_WEIGHT
+            candidates.append(expanded_phrase)
 
-            for course in filtered_courses.filter(
-                courseDescription__icontains=expanded_phrase
-            ):
-                scores[course.id] += PHRASE_MATCH_WEIGHT
+        for candidate in candidates:
+            folded_candidate = candidate.translate(ASCII_LOWERCASE_TABLE)
+            for course, name, description, _ in rows:
+                if name is not None and folded_candidate in name[1]:
+                    scores[course.id] += PHRASE_MATCH_WEIGHT
+                if description is not None and folded_candidate in description[1]:
+                    scores[course.id] += PHRASE_MATCH_WEIGHT
 
 
 def score_similarity(
@@ -594,10 +981,7 @@ def score_similarity(
     """
     if len(search_query) > MIN_CHAR_FOR_COS_SIM:
         # Expand abbreviations in course texts for better matching
-        course_texts = [
-            expand_abbreviations(prepare_course_text(course))
-            for course in filtered_courses
-        ]
+        course_texts = course_similarity_texts(filtered_courses)
 
         # TF-IDF similarity
         tfidf_scores = compute_similarity_scores(expanded_query, course_texts)
@@ -627,8 +1011,6 @@ def score_location_matches(
     - Must contain at least one letter
     - Avoids matching pure numbers (e.g., "207" from "COSC-207")
     """
-    import re
-
     # Check each search term against section locations
     for term in search_terms:
         # Skip terms that are too short or are pure numbers
@@ -638,17 +1020,19 @@ def score_location_matches(
         if term.isdigit():
             continue
         # Skip terms that look like course codes (e.g., "COSC-207", "math111")
-        if re.match(r"^[A-Z]{4}-?\d+[A-Z]?$", term, re.IGNORECASE):
+        if COURSE_CODE_TERM_PATTERN.match(term):
             continue
 
         # Match courses that have sections with this term in the location
         # This will match building codes like "SMUD", "KEEF", "WEBS", etc.
-        location_matches = filtered_courses.filter(
-            sections__location__icontains=term
-        ).distinct()
-
-        for course in location_matches:
-            scores[course.id] += LOCATION_MATCH_WEIGHT
+        folded_term = term.translate(ASCII_LOWERCASE_TABLE)
+        for course in filtered_courses:
+            if any(
+                section.location is not None
+                and folded_term in section.location.translate(ASCII_LOWERCASE_TABLE)
+                for section in course.sections.all()
+            ):
+                scores[course.id] += LOCATION_MATCH_WEIGHT
 
 
 def apply_score_penalties(filtered_courses, scores: dict, search_query: str) -> None:
@@ -722,7 +1106,7 @@ def apply_score_penalties(filtered_courses, scores: dict, search_query: str) ->
                 scores[course.id] *= 0.5
 
             # Get course department codes
-            course_dept_codes = set(course.departments.values_list("code", flat=True))
+            course_dept_codes = {dept.code for dept in course.departments.all()}
             is_stem_course = bool(course_dept_codes & stem_departments)
 
             # Boost STEM courses when STEM query is detected
@@ -872,6 +1256,10 @@ def filter(search_query: str, courses: List[Course]) -> List[Course]:
     # Initialize scores dictionary
     scores = {course.id: 0.0 for course in courses}
 
+    # Course/department code lookups and searched fields shared by every term
+    code_index = build_code_index(filtered_courses)
+    term_match_rows = build_term_match_rows(filtered_courses)
+
     # Check if query is looking for intro courses
     query_lower = search_query.lower()
     wants_intro = any(
@@ -882,33 +1270,34 @@ def filter(search_query: str, courses: List[Course]) -> List[Course]:
     for term in search_terms:
         if term == "half":
             # Special handling for half courses
-            half_courses = filtered_courses.filter(id__regex=r"^.{3}1")
-            for course in half_courses:
-                scores[course.id] += HALF_COURSE_WEIGHT
+            for course in filtered_courses:
+                if HALF_COURSE_ID_PATTERN.search(str(course.id)):
+                    scores[course.id] += HALF_COURSE_WEIGHT
             continue
 
         # Use word boundary matching for short terms to avoid false matches
         use_word_boundary = len(term) <= 3
 
         # Score term matches across all fields
-        score_term_matches(term, filtered_courses, scores, use_word_boundary)
+        score_term_matches(
+            term, filtered_courses, scores, use_word_boundary, term_match_rows
+        )
 
         # Score course code matches (always uses special handling)
-        score_course_codes(term, filtered_courses, scores)
+        score_course_codes(term, filtered_courses, scores, code_index)
 
     # Boost intro courses if query suggests beginner interest
     if wants_intro:
-        intro_courses = filtered_courses.filter(
-            Q(courseName__icontains="introduction")
-            | Q(courseName__icontains="intro")
-            | Q(courseDescription__icontains="introductory")
-        )
-        for course in intro_courses:
-            if scores[course.id] > 0:
+        for course, name, description, _ in term_match_rows:
+            # "intro" also covers "introduction"
+            is_intro = (name is not None and "intro" in name[1]) or (
+                description is not None and "introductory" in description[1]
+            )
+            if is_intro and scores[course.id] > 0:
                 scores[course.id] *= 1.5
 
     # Score phrase matches
-    score_phrase_matches(phrases, filtered_courses, scores)
+    score_phrase_matches(phrases, filtered_courses, scores, term_match_rows)
 
     # Score similarity for longer queries
     score_similarity(search_query, expanded_query, filtered_courses, scores)
@@ -0,0 +1,49 @@
+# Generated by Django 5.1.7 on 2026-10-16 17:45
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("amherst_coursework_algo", "0005_add_course_summary"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="coursecode",
+            name="value",
+            field=models.CharField(
+                db_index=True,
+                help_text="The 8-9 character course code (e.g., 'COSC-111', 'CHEM-165L'). Must follow department code + hyphen + number format.",
+                max_length=9,
+                validators=[
+                    django.core.validators.MinLengthValidator(8),
+                    django.core.validators.MaxLengthValidator(9),
+                ],
+            ),
+        ),
+        migrations.AlterField(
+            model_name="department",
+            name="name",
+            field=models.CharField(
+                db_index=True,
+                help_text="The full name of the department (e.g., 'Computer Science', 'Biology')",
+                max_length=100,
+            ),
+        ),
+        migrations.AlterField(
+            model_name="professor",
+            name="name",
+            field=models.CharField(
+                db_index=True, help_text="Full name of the professor", max_length=100
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="year",
+            index=models.Index(
+                fields=["year", "link"], name="amherst_cou_year_0e1e2d_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.7 on 2026-10-16 17:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("amherst_coursework_algo", "0006_add_lookup_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="course",
+            name="source_hash",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Digest of the catalogue record(s) the course was last loaded from. Used by load_courses to skip unchanged courses.",
+                max_length=32,
+            ),
+        ),
+    ]
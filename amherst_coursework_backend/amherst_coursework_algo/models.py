@@ -125,6 +125,10 @@ class Course(models.Model):
     janOfferings : ManyToManyField to Year
         Years the course is offered in January term
 
+    source_hash : CharField
+        Digest of the catalogue record(s) the course was last loaded from
+        Used by load_courses to skip unchanged courses
+
     Methods
     -------
     __str__()
@@ -170,6 +174,12 @@ class Course(models.Model):
         default="",
         help_text="One-sentence course summary generated by AI.",
     )
+    source_hash = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        help_text="Digest of the catalogue record(s) the course was last loaded from. Used by load_courses to skip unchanged courses.",
+    )
     courseMaterialsLink = models.URLField(
         max_length=200,
         blank=True,
@@ -310,6 +320,7 @@ class CourseCode(models.Model):
 
     value = models.CharField(
         max_length=9,
+        db_index=True,
         validators=[MinLengthValidator(8), MaxLengthValidator(9)],
         help_text="The 8-9 character course code (e.g., 'COSC-111', 'CHEM-165L'). Must follow department code + hyphen + number format.",
     )
@@ -338,6 +349,7 @@ class Department(models.Model):
 
     name = models.CharField(
         max_length=100,
+        db_index=True,
         help_text="The full name of the department (e.g., 'Computer Science', 'Biology')",
     )
     code = models.CharField(
@@ -403,7 +415,9 @@ class Professor(models.Model):
         URL to professor's page on amherst.edu
     """
 
-    name = models.CharField(max_length=100, help_text="Full name of the professor")
+    name = models.CharField(
+        max_length=100, db_index=True, help_text="Full name of the professor"
+    )
     link = models.URLField(
         max_length=200, blank=True, null=True, help_text="Link to professor's page"
     )
@@ -591,6 +605,7 @@ class Year(models.Model):
         verbose_name = "Year"
         verbose_name_plural = "Years"
         ordering = ["year"]
+        indexes = [models.Index(fields=["year", "link"])]
 
 
 class Keyword(models.Model):
@@ -22,6 +22,9 @@ File Structure:
     Output Files:
         - parsed_courses_second_deg.json:
             Final enhanced course information
+        - parsed_courses_second_deg.ndjson:
+            The same courses, one per line with a "dept" key (local only,
+            not committed)
 
 Configuration:
     Environment Variables:
@@ -32,37 +35,53 @@ Configuration:
 Constants:
     - MAX_RETRIES: Maximum retry attempts for failed requests
     - TIMEOUT: Request timeout in seconds
-    - REQUEST_DELAY: Delay between requests
+    - REQUEST_DELAY: Minimum time between the starts of two requests, shared
+      by all concurrent workers
+    - MAX_CONCURRENT_REQUESTS: Default number of pages fetched at once
+    - HTTP_CACHE_EXPIRY: Age in seconds after which a cached page is refetched
+      (pages are cached gzip-compressed under HTTP_CACHE_DIR)
     - EXCLUDED_COURSE_TYPES: Course types to skip
 
 Example Usage:
     >>> from parse_course_catalogue import parse_all_courses_second_deg
     >>> enhanced_courses = parse_all_courses_second_deg()
 
+    Both degrees can also run in one pass, straight from the course pages:
+
+    >>> from parse_course_catalogue import parse_all_courses_fused
+    >>> enhanced_courses = parse_all_courses_fused()
+
 Dependencies:
-    - BeautifulSoup4 for HTML parsing
+    - selectolax (lexbor backend) for HTML parsing
     - Requests for HTTP requests
+    - aiohttp for concurrent course page downloads
     - python-dotenv for environment variables
+    - orjson for faster reading of the JSON files
 """
 
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import gzip
+import hashlib
+import threading
 import time
 from typing import Tuple
+import aiohttp
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 import requests
-from bs4 import BeautifulSoup, NavigableString, Tag
+from selectolax.lexbor import LexborHTMLParser, LexborNode
 import re
 import json
-from typing import List, Dict, Optional
+from typing import AsyncIterator, List, Dict, Optional
 import logging
 import argparse
 import os
 from dotenv import load_dotenv
 import random
 import html
+import orjson
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 # Constants for request handling
@@ -71,6 +90,16 @@ TIMEOUT = 30  # seconds
 BACKOFF_FACTOR = 0.6
 REQUEST_DELAY = 1  # seconds
 RETRY_DELAY_503 = 5  # seconds
+RETRY_STATUSES = [500, 502, 503, 504]
+# Pages downloaded at once. More workers only overlap waiting on responses;
+# requests still start REQUEST_DELAY apart (see RequestThrottle)
+MAX_CONCURRENT_REQUESTS = 1
+
+FETCH_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
+    "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
+    "Accept-Language": "en-US,en;q=0.5",
+}
 
 
 DATA_DIR = os.path.join(
@@ -84,6 +113,13 @@ DEPARTMENT_LINKS_PATH = os.path.join(DATA_DIR, "department_catalogue_links.json"
 DEPARTMENT_COURSES_PATH = os.path.join(DATA_DIR, "all_department_courses.json")
 LEVEL_1_PARSED_COURSES_PATH = os.path.join(DATA_DIR, "parsed_courses_detailed.json")
 LEVEL_2_PARSED_COURSES_PATH = os.path.join(DATA_DIR, "parsed_courses_second_deg.json")
+LEVEL_2_PARSED_COURSES_NDJSON_PATH = os.path.join(
+    DATA_DIR, "parsed_courses_second_deg.ndjson"
+)
+
+# Downloaded pages are kept here so a rerun doesn't hit the server again
+HTTP_CACHE_DIR = os.path.join(DATA_DIR, "http_cache")
+HTTP_CACHE_EXPIRY = 86400  # seconds
 
 # Course types to exclude from the catalog (for now);
 # later, to consider whether to consider, check out the catalogue AND
@@ -142,11 +178,115 @@ def get_request_headers() -> dict:
     return headers
 
 
-def parse_department_catalogue(department_url: str) -> List[str]:
+def read_json_file(path: str):
+    """Load a JSON file with orjson."""
+    with open(path, "rb") as f:
+        return orjson.loads(f.read())
+
+
+def write_json_file(path: str, data):
+    """Write data as JSON indented by four spaces.
+
+    The output files are committed, so they are written with the json module
+    in the format they already have rather than with orjson, which only
+    indents by two spaces and writes raw UTF-8.
+    """
+    with open(path, "w") as f:
+        json.dump(data, f, indent=4)
+
+
+class RequestThrottle:
+    """Space the starts of requests at least REQUEST_DELAY seconds apart.
+
+    One throttle is shared by every worker fetching from the server, so
+    raising the number of workers never raises the request rate.
+
+    Args:
+        delay (Optional[float]): Seconds between request starts; defaults to
+            REQUEST_DELAY
+    """
+
+    def __init__(self, delay: Optional[float] = None):
+        self.delay = REQUEST_DELAY if delay is None else delay
+        self._lock = threading.Lock()
+        self._next_start = 0.0
+
+    def _reserve(self) -> float:
+        """Claim the next start time and return how long to wait for it."""
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_start)
+            self._next_start = start + self.delay
+            return start - now
+
+    def wait(self):
+        """Block the calling thread until it may start a request."""
+        time.sleep(self._reserve())
+
+    async def wait_async(self):
+        """Wait, without blocking the event loop, until a request may start."""
+        await asyncio.sleep(self._reserve())
+
+
+def cached_page_path(url: str) -> str:
+    """Return the gzip file a page is cached in, named by a hash of its URL."""
+    return os.path.join(
+        HTTP_CACHE_DIR, hashlib.sha256(url.encode()).hexdigest() + ".html.gz"
+    )
+
+
+def read_cached_page(url: str) -> Optional[str]:
+    """Read a page from the HTTP cache.
+
+    Args:
+        url (str): URL the page was fetched from
+
+    Returns:
+        Optional[str]: The page content, or None if it is not cached or
+        older than HTTP_CACHE_EXPIRY
+    """
+    path = cached_page_path(url)
+    try:
+        if time.time() - os.path.getmtime(path) < HTTP_CACHE_EXPIRY:
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                return f.read()
+    except (OSError, EOFError):
+        pass
+    return None
+
+
+def write_cached_page(url: str, content: str):
+    """Store a fetched page in the HTTP cache.
+
+    The page is gzip-compressed into a temporary file and renamed into
+    place, so concurrent fetches never leave a partial page behind.
+
+    Args:
+        url (str): URL the page was fetched from
+        content (str): Page content
+    """
+    os.makedirs(HTTP_CACHE_DIR, exist_ok=True)
+    path = cached_page_path(url)
+    tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with gzip.open(tmp_path, "wt", encoding="utf-8", compresslevel=6) as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def parse_department_catalogue(
+    department_url: str,
+    session: Optional[requests.Session] = None,
+    use_cache: bool = True,
+    throttle: Optional[RequestThrottle] = None,
+) -> List[str]:
     """Parse a department page and extract course links.
 
     Args:
         department_url (str): URL of department course catalog page
+        session (requests.Session, optional): Session to reuse connections
+            from; a one-off request is made if omitted
+        use_cache (bool): Read and store the page in the HTTP cache
+        throttle (RequestThrottle, optional): Waited on before the request
 
     Returns:
         List[str]: List of course URLs found in the department page
@@ -159,22 +299,31 @@ def parse_department_catalogue(department_url: str) -> List[str]:
     headers = get_request_headers()
 
     try:
-        logger.info(f"Fetching department page: {department_url}")
-        response = requests.get(department_url, headers=headers, timeout=10)
-        response.raise_for_status()
+        content = read_cached_page(department_url) if use_cache else None
+        if content is None:
+            logger.info(f"Fetching department page: {department_url}")
+            if throttle is not None:
+                throttle.wait()
+            response = (session or requests).get(
+                department_url, headers=headers, timeout=10
+            )
+            response.raise_for_status()
+            content = response.text
+            if use_cache:
+                write_cached_page(department_url, content)
 
-        soup = BeautifulSoup(response.text, "html.parser")
-        course_list = soup.find("div", id="academics-course-list")
+        tree = LexborHTMLParser(content)
+        course_list = tree.css_first("div#academics-course-list")
 
-        if not course_list:
+        if course_list is None:
             logger.error(f"No course list found for {department_url}")
             return []
 
         course_links = []
-        for course_div in course_list.find_all("div", class_="course-subj"):
-            link = course_div.find("a")
-            if link and link.get("href"):
-                course_url = link["href"]
+        for course_div in course_list.css("div.course-subj"):
+            link = course_div.css_first("a")
+            if link is not None and link.attributes.get("href"):
+                course_url = link.attributes["href"]
                 if not course_url.startswith("http"):
                     course_url = "https://www.amherst.edu" + course_url
                 course_links.append(course_url)
@@ -190,32 +339,42 @@ def parse_department_catalogue(department_url: str) -> List[str]:
         return []
 
 
-def get_all_department_courses():
-    """Run parse_department_catalogue on all departments."""
+def get_all_department_courses(
+    max_workers: int = MAX_CONCURRENT_REQUESTS, use_cache: bool = True
+):
+    """Run parse_department_catalogue on all departments.
+
+    Department pages are fetched from a thread pool sharing one session and
+    one RequestThrottle, so extra threads overlap waiting on the network
+    without raising the request rate.
+
+    Args:
+        max_workers (int): Maximum number of department pages fetched at once
+        use_cache (bool): Read and store pages in the HTTP cache
+    """
     try:
         # Read department links from JSON file
-        with open(
-            DEPARTMENT_LINKS_PATH,
-            "r",
-        ) as f:
-            departments = json.load(f)
+        departments = read_json_file(DEPARTMENT_LINKS_PATH)
 
         all_courses = {}
+        session = create_session(pool_size=max_workers)
+        throttle = RequestThrottle()
 
         # Parse each department's courses
-        for dept in departments:
-            dept_name = dept["name"]
-            dept_url = dept["url"]
-            logger.info(f"Processing department: {dept_name}")
-
-            # Get course links for this department
-            course_links = parse_department_catalogue(dept_url)
-            all_courses[dept_name] = course_links
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = executor.map(
+                lambda dept: parse_department_catalogue(
+                    dept["url"], session, use_cache, throttle
+                ),
+                departments,
+            )
+            for dept, course_links in zip(departments, results):
+                logger.info(f"Processed department: {dept['name']}")
+                all_courses[dept["name"]] = course_links
 
         # Save results to JSON file
         output_path = DEPARTMENT_COURSES_PATH
-        with open(output_path, "w") as f:
-            json.dump(all_courses, f, indent=4)
+        write_json_file(output_path, all_courses)
 
         logger.info(f"Saved department courses to {output_path}")
         return all_courses
@@ -230,29 +389,76 @@ def get_all_department_courses():
 
 
 # Helper function to find all siblings including text nodes
-def find_next_siblings_with_text(tag, limit: int = -1):
-    """Find siblings (including text nodes) that come after the given tag.
+def find_next_siblings_with_text(node: LexborNode, limit: int = -1):
+    """Find siblings (including text nodes) that come after the given node.
 
     Args:
-        tag: The starting tag to find siblings from
+        node: The starting node to find siblings from
         limit: Maximum number of siblings to return. -1 means no limit.
 
     Returns:
-        List of siblings (Tags and text nodes)
+        List of siblings (element nodes and stripped text)
     """
-    current = tag.next_sibling
+    current = node.next
     siblings = []
-    while current and (limit == -1 or len(siblings) < limit):
-        if isinstance(current, (NavigableString, Tag)):
-            # Only add non-empty text nodes
-            if isinstance(current, NavigableString) and current.strip():
-                siblings.append(current.strip())
-            elif isinstance(current, Tag):
-                siblings.append(current)
-        current = current.next_sibling
+    while current is not None and (limit == -1 or len(siblings) < limit):
+        # Only add non-empty text nodes
+        if current.is_text_node:
+            text = current.text().strip()
+            if text:
+                siblings.append(text)
+        elif current.is_element_node:
+            siblings.append(current)
+        current = current.next
     return siblings
 
 
+def find_next_element(
+    node: LexborNode, tag: str, root: LexborNode
+) -> Optional[LexborNode]:
+    """Find the first ``tag`` element after the given node in document order.
+
+    The node's own descendants are searched first, and the search never
+    leaves ``root``.
+
+    Args:
+        node: The node to start searching after
+        tag: Tag name to look for
+        root: Subtree the search is confined to
+
+    Returns:
+        The matching element, or None if there is none
+    """
+    current = node
+    while current is not None:
+        if current.child is not None:
+            current = current.child
+        else:
+            while current != root and current.next is None:
+                current = current.parent
+            current = None if current == root else current.next
+        if current is not None and current.tag == tag:
+            return current
+    return None
+
+
+def find_by_text(root: LexborNode, selector: str, match) -> Optional[LexborNode]:
+    """Find the first element matching ``selector`` whose text satisfies ``match``.
+
+    Args:
+        root: Subtree to search
+        selector: CSS selector for candidate elements
+        match: Predicate called with each candidate's text
+
+    Returns:
+        The first matching element, or None if there is none
+    """
+    for candidate in root.css(selector):
+        if match(candidate.text()):
+            return candidate
+    return None
+
+
 def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
     """Parse basic course information from HTML content.
 
@@ -279,42 +485,38 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
             logger.error("Empty HTML content provided")
             return None
 
-        soup = BeautifulSoup(html_content, "html.parser")
-        course_div = soup.find("div", id="academics-course-list")
-        if not course_div:
+        tree = LexborHTMLParser(html_content)
+        course_div = tree.css_first("div#academics-course-list")
+        if course_div is None:
             logger.error("Could not find course list div")
             return None
 
-        soup = course_div
-
         # Extract basic info
-        course_title = soup.find("h3")
-        if not course_title:
+        course_title = course_div.css_first("h3")
+        if course_title is None:
             logger.error("Could not find course title (h3 tag)")
             return None
         # Decode HTML entities in course name (e.g., &amp; -> &, &oacute; -> ó)
-        course_name = html.unescape(course_title.text.strip())
+        course_name = html.unescape(course_title.text().strip())
         logger.debug(f"Successfully extracted course name: {course_name}")
 
         # Extract departments info
-        dept_p = soup.find("p")
-        while dept_p is not None and "Listed in:" not in dept_p.text:
-            dept_p = dept_p.find_next("p")
+        dept_p = find_by_text(course_div, "p", lambda t: "Listed in:" in t)
 
-        if not dept_p:
+        if dept_p is None:
             logger.warning(
                 "Department information not found, setting empty departments and acronyms"
             )
             departments, acronyms = {}, []
         else:
             departments = {}
-            for a in dept_p.find_all("a"):
-                link = a.get("href", "")
+            for a in dept_p.css("a"):
+                link = a.attributes.get("href") or ""
                 if "https" not in link:
                     link = "https://www.amherst.edu" + link
-                departments[a.text.strip()] = link
+                departments[a.text().strip()] = link
 
-            acronyms = re.findall(r"[A-Z]+-\d+[A-Z]?", dept_p.text)
+            acronyms = re.findall(r"[A-Z]+-\d+[A-Z]?", dept_p.text())
 
             if not departments:
                 logger.warning("No departments found in department section")
@@ -326,22 +528,22 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
 
         # Extract course materials links
         materials_links = []
-        materials_section = soup.find(
-            "summary", string=lambda t: t and "Course Materials" in t
+        materials_section = find_by_text(
+            course_div, "summary", lambda t: "Course Materials" in t
         )
-        if materials_section:
-            materials_div = materials_section.parent.find(
-                "div", class_="details-wrapper"
-            )
-            if materials_div:
-                for link in materials_div.find_all("a"):
-                    href = link.get("href", "")
+        if materials_section is not None:
+            materials_div = materials_section.parent.css_first("div.details-wrapper")
+            if materials_div is not None:
+                for link in materials_div.css("a"):
+                    href = link.attributes.get("href")
                     if href:
                         materials_links.append(href)
         else:
-            materials_link = soup.find("a", string="Course Materials")
-            if materials_link:
-                href = materials_link.get("href", "")
+            materials_link = find_by_text(
+                course_div, "a", lambda t: t == "Course Materials"
+            )
+            if materials_link is not None:
+                href = materials_link.attributes.get("href")
                 if href:
                     materials_links.append(href)
 
@@ -351,13 +553,17 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
             logger.debug(f"Found {len(materials_links)} course material links")
 
         # Extract description
-        desc_header = soup.find("h4", string="Description")
-        if not desc_header:
+        desc_header = find_by_text(course_div, "h4", lambda t: t == "Description")
+        if desc_header is None:
             logger.warning("Description section not found, setting empty description")
             description = ""
         else:
             description = " ".join(
-                [p.text.strip() for p in desc_header.find_next_siblings("p")]
+                [
+                    p.text().strip()
+                    for p in find_next_siblings_with_text(desc_header)
+                    if isinstance(p, LexborNode) and p.tag == "p"
+                ]
             )
             # Decode HTML entities in description
             description = html.unescape(description)
@@ -367,14 +573,14 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
                 logger.debug("Successfully extracted course description")
 
         # Extract times and location
-        times_section = soup.find(
-            "summary", string=lambda t: t and "Course times and locations" in t
+        times_section = find_by_text(
+            course_div, "summary", lambda t: "Course times and locations" in t
         )
-        if not times_section:
+        if times_section is None:
             logger.warning("Course times section not found, setting empty times_html")
             times_html = ""
         else:
-            times_html = str(times_section.parent)
+            times_html = times_section.parent.html
             if not times_html:
                 logger.warning("Empty course times and locations found")
             else:
@@ -382,27 +588,32 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
 
         # Get professors information
         professors = []
-        faculty_header = soup.find("h4", string="Faculty")
+        faculty_header = find_by_text(course_div, "h4", lambda t: t == "Faculty")
 
-        if faculty_header:
+        if faculty_header is not None:
             logger.debug("Found Faculty section header")
-            faculty_p = faculty_header.find_next("p")
+            faculty_p = find_next_element(faculty_header, "p", course_div)
 
-            if faculty_p:
-                faculty_links = faculty_p.find_all("a")
+            if faculty_p is not None:
+                faculty_links = faculty_p.css("a")
                 logger.debug(f"Found {len(faculty_links)} faculty links")
 
                 for link in faculty_links:
                     try:
-                        prof_name = link.text.strip()
-                        prof_link = link["href"]
+                        prof_name = link.text().strip()
+                        prof_link = link.attributes["href"]
                         if not prof_link.startswith("http"):
                             prof_link = "https://www.amherst.edu" + prof_link
 
                         # Find the next text node after the link and look for section number(s)
                         # Handle both singular "Section" and plural "Sections"
                         # Also handle multiple sections like "Sections 01 and 01L"
-                        next_text = link.next_sibling
+                        next_node = link.next
+                        next_text = (
+                            next_node.text()
+                            if next_node is not None and next_node.is_text_node
+                            else None
+                        )
                         sections = []
                         if next_text:
                             # Try to match single section: (Section 01)
@@ -460,7 +671,7 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
             logger.warning("No professor information found for this course")
 
         # Extract divisions and keywords
-        keywords_header = soup.find("h4", string="Keywords")
+        keywords_header = find_by_text(course_div, "h4", lambda t: t == "Keywords")
         divisions = []
         keywords = []
         if not keywords_header:
@@ -468,10 +679,14 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
                 "Keywords section not found, setting empty divisions and keywords"
             )
         else:
-            keywords_p = keywords_header.find_next("p")
-            if keywords_p:
+            keywords_p = find_next_element(keywords_header, "p", course_div)
+            if keywords_p is not None:
                 # Split content by <br> tag
-                sections = [text for text in keywords_p.stripped_strings]
+                sections = [
+                    node.text().strip()
+                    for node in keywords_p.traverse(include_text=True)
+                    if node.is_text_node and node.text().strip()
+                ]
 
                 for section in sections:
                     if "Divisions:" in section:
@@ -496,15 +711,15 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
         # Extract previous years offered
         offerings = {}
         offerings_text = []
-        offerings_header = soup.find("h4", string="Offerings")
+        offerings_header = find_by_text(course_div, "h4", lambda t: t == "Offerings")
         if not offerings_header:
             logger.warning("Offerings section not found, setting empty offerings")
         else:
             for element in find_next_siblings_with_text(offerings_header):
-                if isinstance(element, Tag) and element.name == "a":
-                    text = element.text.strip()
+                if isinstance(element, LexborNode) and element.tag == "a":
+                    text = element.text().strip()
                     if text:
-                        link = element.get("href", "")
+                        link = element.attributes.get("href") or ""
                         if "https" not in link:
                             link = "https://www.amherst.edu" + link
                         offerings[text] = link
@@ -559,31 +774,37 @@ def parse_course_first_deg(html_content: str, course_url: str) -> Optional[str]:
         return None
 
 
-def create_session() -> requests.Session:
-    """Create a requests session with retry logic"""
+def create_session(pool_size: int = MAX_CONCURRENT_REQUESTS) -> requests.Session:
+    """Create a requests session with retry logic
+
+    Args:
+        pool_size (int): Connections kept open per host, at least the number
+            of threads sharing the session
+    """
     session = requests.Session()
     retry_strategy = Retry(
         total=MAX_RETRIES,
         backoff_factor=BACKOFF_FACTOR,
-        status_forcelist=[500, 502, 503, 504],
+        status_forcelist=RETRY_STATUSES,
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
+    adapter = HTTPAdapter(max_retries=retry_strategy, pool_maxsize=pool_size)
     session.mount("http://", adapter)
     session.mount("https://", adapter)
     return session
 
 
-def fetch_url_with_retry(url: str, session: requests.Session) -> Tuple[bool, str]:
+def fetch_url_with_retry(
+    url: str, session: requests.Session, use_cache: bool = True
+) -> Tuple[bool, str]:
     """Fetch URL content with retry logic"""
-    headers = {
-        "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36",
-        "Accept": "text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8",
-        "Accept-Language": "en-US,en;q=0.5",
-    }
-
+    content = read_cached_page(url) if use_cache else None
+    if content is not None:
+        return True, content
     try:
-        response = session.get(url, headers=headers, timeout=TIMEOUT)
+        response = session.get(url, headers=FETCH_HEADERS, timeout=TIMEOUT)
         response.raise_for_status()
+        if use_cache:
+            write_cached_page(url, response.text)
         time.sleep(REQUEST_DELAY)  # Add delay between requests
         return True, response.text
     except Exception as e:
@@ -591,52 +812,171 @@ def fetch_url_with_retry(url: str, session: requests.Session) -> Tuple[bool, str
         return False, ""
 
 
+async def fetch_url_async(
+    url: str,
+    session: aiohttp.ClientSession,
+    semaphore: asyncio.Semaphore,
+    throttle: RequestThrottle,
+    use_cache: bool = True,
+) -> Tuple[bool, str]:
+    """Fetch URL content asynchronously with retry logic.
+
+    Mirrors fetch_url_with_retry: server errors and dropped connections are
+    retried with exponential backoff. At most ``semaphore`` requests are in
+    flight, and every attempt waits on the shared ``throttle`` first, so
+    requests start REQUEST_DELAY apart however many are in flight. Cached
+    pages are returned without a request; the cache is read and written in
+    a worker thread so the event loop keeps serving the other fetches.
+
+    Args:
+        url (str): URL to fetch
+        session (aiohttp.ClientSession): Shared session (connection pool)
+        semaphore (asyncio.Semaphore): Bounds the number of concurrent requests
+        throttle (RequestThrottle): Spaces requests across all fetches
+        use_cache (bool): Read and store the page in the HTTP cache
+
+    Returns:
+        Tuple[bool, str]: Whether the fetch succeeded, and the page content
+    """
+    content = await asyncio.to_thread(read_cached_page, url) if use_cache else None
+    if content is not None:
+        return True, content
+    async with semaphore:
+        for attempt in range(MAX_RETRIES + 1):
+            await throttle.wait_async()
+            try:
+                async with session.get(url) as response:
+                    if response.status in RETRY_STATUSES and attempt < MAX_RETRIES:
+                        await asyncio.sleep(BACKOFF_FACTOR * 2**attempt)
+                        continue
+                    response.raise_for_status()
+                    content = await response.text()
+                if use_cache:
+                    await asyncio.to_thread(write_cached_page, url, content)
+                return True, content
+            except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                if attempt < MAX_RETRIES:
+                    await asyncio.sleep(BACKOFF_FACTOR * 2**attempt)
+                    continue
+                logger.error(f"Error fetching {url}: {str(e)}")
+                return False, ""
+            except Exception as e:
+                logger.error(f"Error fetching {url}: {str(e)}")
+                return False, ""
+
+
+async def fetch_all_urls(
+    urls: List[str],
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    use_cache: bool = True,
+) -> AsyncIterator[Tuple[int, bool, str]]:
+    """Fetch many URLs over one connection pool, yielding pages as they arrive.
+
+    Each page can be processed and dropped as soon as it is downloaded, so
+    only the pages waiting to be processed are held in memory.
+
+    Args:
+        urls (List[str]): URLs to fetch
+        max_concurrency (int): Maximum number of requests in flight
+        use_cache (bool): Read and store pages in the HTTP cache
+
+    Yields:
+        Tuple[int, bool, str]: Index of the URL in ``urls``, then the
+        fetch_url_async result, in order of completion
+    """
+    semaphore = asyncio.Semaphore(max_concurrency)
+    throttle = RequestThrottle()
+
+    async with aiohttp.ClientSession(
+        headers=FETCH_HEADERS, timeout=aiohttp.ClientTimeout(total=TIMEOUT)
+    ) as session:
+
+        async def fetch(index: int, url: str) -> Tuple[int, bool, str]:
+            return (
+                index,
+                *await fetch_url_async(url, session, semaphore, throttle, use_cache),
+            )
+
+        tasks = [asyncio.ensure_future(fetch(i, url)) for i, url in enumerate(urls)]
+        try:
+            for next_page in asyncio.as_completed(tasks):
+                yield await next_page
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
 def save_incremental_results(output_path: str, all_courses: Dict):
     """Save results to JSON file incrementally."""
-    with open(output_path, "w") as f:
-        json.dump(all_courses, f, indent=4)
+    write_json_file(output_path, all_courses)
     logger.info(f"Saved incremental results to {output_path}")
 
 
-def parse_all_courses(testing_mode: bool = False):
-    """Parse all course pages using parse_course_first_deg."""
+def parse_all_courses(
+    testing_mode: bool = False,
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS,
+    use_cache: bool = True,
+    save_results: bool = True,
+):
+    """Parse all course pages using parse_course_first_deg.
+
+    Args:
+        testing_mode (bool): Save results after every parsed course
+        max_concurrency (int): Maximum number of course pages fetched at once
+        use_cache (bool): Read and store pages in the HTTP cache
+        save_results (bool): Write the results to parsed_courses_detailed.json
+    """
     output_path = LEVEL_1_PARSED_COURSES_PATH
-    failed_urls = []
+    failed_jobs = []
 
     try:
         # Load all department courses
-        with open(DEPARTMENT_COURSES_PATH, "r") as f:
-            departments = json.load(f)
+        departments = read_json_file(DEPARTMENT_COURSES_PATH)
 
-        all_courses = {}
         session = create_session()
-        total_courses = sum(len(courses) for courses in departments.values())
-        processed = 0
-
-        # Process each department
-        for dept_name, course_urls in departments.items():
-            logger.info(f"Processing department: {dept_name}")
-            all_courses[dept_name] = []
-
-            for url in course_urls:
+        jobs = [
+            (dept_name, url) for dept_name, urls in departments.items() for url in urls
+        ]
+        total_courses = len(jobs)
+        # Parsed course of each job, filled in as its page arrives
+        parsed = [None] * total_courses
+
+        def collect_courses() -> Dict:
+            """Parsed courses by department, in catalogue order."""
+            all_courses = {dept_name: [] for dept_name in departments}
+            for (dept_name, _), course in zip(jobs, parsed):
+                if course is not None:
+                    all_courses[dept_name].append(course)
+            return all_courses
+
+        async def fetch_and_parse():
+            """Parse each course page as soon as it is downloaded."""
+            processed = 0
+            async for index, success, content in fetch_all_urls(
+                [url for _, url in jobs], max_concurrency, use_cache
+            ):
+                dept_name, url = jobs[index]
                 processed += 1
                 logger.info(f"Processing course {processed}/{total_courses}: {url}")
 
-                success, content = fetch_url_with_retry(url, session)
                 if not success:
-                    failed_urls.append((dept_name, url))
+                    failed_jobs.append(index)
                     continue
 
                 try:
                     course_data = parse_course_first_deg(content, url)
                     if course_data:
-                        all_courses[dept_name].append(json.loads(course_data))
+                        parsed[index] = json.loads(course_data)
                         if testing_mode:
-                            save_incremental_results(output_path, all_courses)
+                            save_incremental_results(output_path, collect_courses())
                 except Exception as e:
                     logger.error(f"Error parsing course content for {url}: {e}")
-                    failed_urls.append((dept_name, url))
-                    continue
+                    failed_jobs.append(index)
+
+        logger.info(f"Fetching {total_courses} course pages...")
+        asyncio.run(fetch_and_parse())
+        all_courses = collect_courses()
+        failed_urls = [jobs[index] for index in sorted(failed_jobs)]
 
         # Retry failed URLs with longer delays
         if failed_urls:
@@ -644,7 +984,7 @@ def parse_all_courses(testing_mode: bool = False):
             for dept_name, url in failed_urls:
                 for retry in range(MAX_RETRIES):
                     time.sleep(RETRY_DELAY_503 * (retry + 1))  # Progressive delay
-                    success, content = fetch_url_with_retry(url, session)
+                    success, content = fetch_url_with_retry(url, session, use_cache)
                     if success:
                         try:
                             course_data = parse_course_first_deg(content, url)
@@ -656,7 +996,8 @@ def parse_all_courses(testing_mode: bool = False):
                                 f"Error parsing course content for {url} on retry: {e}"
                             )
 
-        save_incremental_results(output_path, all_courses)
+        if save_results:
+            save_incremental_results(output_path, all_courses)
         return all_courses
 
     except FileNotFoundError:
@@ -667,18 +1008,29 @@ def parse_all_courses(testing_mode: bool = False):
         return {}
 
 
-def parse_all_courses_second_deg():
-    """Parse all courses to generate enhanced course information."""
+def parse_all_courses_second_deg(departments: Optional[Dict] = None):
+    """Parse all courses to generate enhanced course information.
+
+    Results are also written as newline-delimited JSON, one course per line
+    tagged with its department, which load_courses can read without holding
+    the whole catalogue in memory.
+
+    Args:
+        departments (Optional[Dict]): First degree parsed courses by
+            department; read from parsed_courses_detailed.json if omitted
+    """
     input_path = LEVEL_1_PARSED_COURSES_PATH
     output_path = LEVEL_2_PARSED_COURSES_PATH
+    ndjson_path = LEVEL_2_PARSED_COURSES_NDJSON_PATH
 
     try:
         # Load existing first degree parsed courses
-        with open(input_path, "r") as f:
-            departments = json.load(f)
+        if departments is None:
+            departments = read_json_file(input_path)
 
         # Initialize output structure
         enhanced_courses = {}
+        open(ndjson_path, "w").close()
 
         total_depts = len(departments)
         for dept_idx, (dept_name, courses) in enumerate(departments.items(), 1):
@@ -704,8 +1056,11 @@ def parse_all_courses_second_deg():
                     continue
 
             # Save results incrementally after each department
-            with open(output_path, "w") as f:
-                json.dump(enhanced_courses, f, indent=4)
+            write_json_file(output_path, enhanced_courses)
+            with open(ndjson_path, "ab") as f:
+                for course in enhanced_courses[dept_name]:
+                    line = {"dept": dept_name, **course}
+                    f.write(orjson.dumps(line) + b"\n")
             logger.debug(f"Saved incremental results for {dept_name}")
 
         logger.info(f"Completed second degree parsing. Results saved to {output_path}")
@@ -719,6 +1074,30 @@ def parse_all_courses_second_deg():
         return {}
 
 
+def parse_all_courses_fused(
+    max_concurrency: int = MAX_CONCURRENT_REQUESTS, use_cache: bool = True
+):
+    """Run both parsing degrees in one pass over the course pages.
+
+    First degree results are handed to the second degree in memory, so
+    parsed_courses_detailed.json is neither written nor read back.
+
+    Args:
+        max_concurrency (int): Maximum number of course pages fetched at once
+        use_cache (bool): Read and store pages in the HTTP cache
+
+    Returns:
+        Dict: Enhanced course information by department, as written by
+        parse_all_courses_second_deg
+    """
+    first_degree = parse_all_courses(
+        max_concurrency=max_concurrency, use_cache=use_cache, save_results=False
+    )
+    if not first_degree:
+        return {}
+    return parse_all_courses_second_deg(first_degree)
+
+
 def parse_course_second_deg(course_data: dict) -> dict:
     """
     Parse additional course information and restructure data.
@@ -751,16 +1130,16 @@ def parse_course_second_deg(course_data: dict) -> dict:
 
         # Parse course times and location
         if course_data.get("course_times_location"):
-            soup = BeautifulSoup(course_data["course_times_location"], "html.parser")
+            tree = LexborHTMLParser(course_data["course_times_location"])
 
             # Find all section elements
-            sections = soup.find_all("p")
+            sections = tree.css("p")
 
             for section in sections:
                 # Extract section number
-                strong = section.find("strong")
-                if strong:
-                    section_num = strong.text.strip().replace("Section ", "")
+                strong = section.css_first("strong")
+                if strong is not None:
+                    section_num = strong.text().strip().replace("Section ", "")
 
                     # Initialize section info with all days set to null
                     section_info[section_num] = {
@@ -784,16 +1163,17 @@ def parse_course_second_deg(course_data: dict) -> dict:
                         "sun_end_time": None,
                     }
 
-                    # Get the original HTML content with <br> tags
-                    section_html = str(section)
-
-                    # Split by <br> tags and clean up
-                    lines = re.split(r"<br\s*/?>", section_html)
+                    # Split the section's text at <br> tags
+                    lines = [""]
+                    for node in section.traverse(include_text=True):
+                        if node.tag == "br":
+                            lines.append("")
+                        elif node.is_text_node:
+                            lines[-1] += node.text()
 
                     # Skip the first line as it contains the section number
                     for line in lines[1:]:
-                        # Clean HTML tags
-                        clean_line = re.sub(r"<[^>]*>", "", line).strip()
+                        clean_line = line.strip()
                         if clean_line:
                             # Try to extract time and location
                             pattern = r"(M|Tu|W|Th|F|Sa|Su)[\s.]*(\d{1,2}:\d{2}\s*[AP]M)\s*-\s*(\d{1,2}:\d{2}\s*[AP]M)[\s.]*([A-Za-z0-9\s]+)"
@@ -926,5 +1306,7 @@ if __name__ == "__main__":
     )
     args = parser.parse_args()
 
+    # Configure logging
+    logging.basicConfig(level=logging.INFO)
     logger.setLevel(getattr(logging, args.log_level))
     parse_all_courses_second_deg()
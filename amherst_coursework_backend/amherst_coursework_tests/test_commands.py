@@ -10,12 +10,25 @@ from amherst_coursework_algo.models import (
     Year,
 )
 import json
+import os
+import tempfile
 from io import StringIO
+from datetime import time
+from unittest import mock
 from django.core.management.base import CommandError
+from django.db import transaction
+from amherst_coursework_algo.management.commands.load_courses import Command
 
 
 class TestLoadCourses(TestCase):
 
+    def setUp(self):
+        # The catalogue files each test writes go to a scratch directory
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.addCleanup(os.chdir, os.getcwd())
+        os.chdir(tmp_dir.name)
+
     def test_load_basic_course_data(self):
         """Test loading basic course data without relationships"""
 
@@ -43,6 +56,30 @@ class TestLoadCourses(TestCase):
         self.assertEqual(course.courseName, "Test Course 1")
         self.assertEqual(course.courseDescription, "Test course description")
 
+    def test_load_inside_callers_transaction(self):
+        """Test that the load can run inside a transaction the caller holds"""
+        with open("test_courses.json", "w") as f:
+            json.dump(
+                {
+                    "Computer Science": [
+                        {
+                            "course_name": "Test Course",
+                            "course_acronyms": ["COSC-101"],
+                            "departments": {
+                                "Computer Science": "https://test.edu/dept"
+                            },
+                            "description": "Test course description",
+                        }
+                    ]
+                },
+                f,
+            )
+
+        with transaction.atomic():
+            call_command("load_courses", "test_courses.json")
+
+        self.assertEqual(Course.objects.get().courseName, "Test Course")
+
     def test_load_course_with_offerings(self):
         """Test loading course with offerings data"""
 
@@ -283,3 +320,655 @@ class TestLoadCourses(TestCase):
         self.assertIsNone(section.monday_end_time)
         self.assertEqual(section.tuesday_start_time.strftime("%I:%M %p"), "11:00 AM")
         self.assertEqual(section.thursday_end_time.strftime("%I:%M %p"), "12:15 PM")
+
+    def test_load_course_with_required_prerequisites(self):
+        """Test that each required prerequisite group becomes its own set"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Data Structures",
+                    "course_acronyms": ["COSC-211"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "prerequisites": {
+                        "text": "COSC-111 or COSC-112",
+                        "required": [[4130111], [4130112, 4130113]],
+                    },
+                }
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json")
+
+        course = Course.objects.get(id=4130211)
+        prereq_sets = list(course.required_courses.order_by("id"))
+        self.assertEqual(len(prereq_sets), 2)
+        self.assertEqual(
+            [c.id for c in prereq_sets[0].courses.order_by("id")], [4130111]
+        )
+        self.assertEqual(
+            [c.id for c in prereq_sets[1].courses.order_by("id")],
+            [4130112, 4130113],
+        )
+
+    def test_shared_lookup_rows_are_reused(self):
+        """Test that departments and professors are shared rather than duplicated"""
+        Department.objects.create(
+            name="Computer Science", code="COSC", link="https://test.edu/dept"
+        )
+        section = {
+            "01": {
+                "professor_name": "Dr. Smith",
+                "professor_link": "https://test.edu/smith",
+                "course_location": "Room 101",
+            }
+        }
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": f"Test Course {number}",
+                    "course_acronyms": [f"COSC-{number}"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "offerings": {"Fall 2024": "https://test.edu/fall2024"},
+                    "section_information": section,
+                }
+                for number in (101, 102)
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json")
+
+        self.assertEqual(Course.objects.count(), 2)
+        self.assertEqual(Department.objects.count(), 1)
+        self.assertEqual(Professor.objects.filter(name="Dr. Smith").count(), 1)
+        self.assertEqual(Year.objects.count(), 1)
+        for course in Course.objects.all():
+            self.assertEqual(course.departments.get().name, "Computer Science")
+            self.assertEqual(course.professors.get().name, "Dr. Smith")
+
+    def test_referenced_courses_created_as_stubs(self):
+        """Test that referenced course IDs resolve to stubs or loaded courses"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Algorithms",
+                    "course_acronyms": ["COSC-311"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "prerequisites": {
+                        "recommended": [4130211],
+                        "placement": 4130111,
+                    },
+                    "corequisites": [4130312],
+                },
+                {
+                    "course_name": "Data Structures",
+                    "course_acronyms": ["COSC-211"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                },
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json")
+
+        course = Course.objects.get(id=4130311)
+        self.assertEqual(course.placement_course_id, 4130111)
+        self.assertEqual(
+            list(course.recommended_courses.values_list("courseName", flat=True)),
+            ["Data Structures"],
+        )
+        self.assertEqual(
+            list(course.corequisites.values_list("id", flat=True)), [4130312]
+        )
+        self.assertEqual(Course.objects.count(), 4)
+
+    def test_reload_updates_existing_course(self):
+        """Test that loading again updates fields of courses already in the database"""
+        course_data = {
+            "course_name": "Test Course",
+            "course_acronyms": ["COSC-101"],
+            "departments": {"Computer Science": "https://test.edu/dept"},
+            "description": "Test course description",
+        }
+        with open("test_courses.json", "w") as f:
+            json.dump({"Computer Science": [course_data]}, f)
+        call_command("load_courses", "test_courses.json")
+
+        course_data["course_name"] = "Renamed Course"
+        course_data["section_information"] = {
+            "01": {"course_materials_links": "https://test.edu/books"}
+        }
+        with open("test_courses.json", "w") as f:
+            json.dump({"Computer Science": [course_data]}, f)
+        call_command("load_courses", "test_courses.json")
+
+        course = Course.objects.get()
+        self.assertEqual(course.courseName, "Renamed Course")
+        self.assertEqual(course.courseMaterialsLink, "https://test.edu/books")
+
+    def test_reload_skips_unchanged_course(self):
+        """Test that courses whose records are unchanged are not written again"""
+        course_data = {
+            "course_name": "Test Course",
+            "course_acronyms": ["COSC-101"],
+            "departments": {"Computer Science": "https://test.edu/dept"},
+            "description": "Test course description",
+        }
+        with open("test_courses.json", "w") as f:
+            json.dump({"Computer Science": [course_data]}, f)
+        with mock.patch.object(
+            Command, "generate_course_summary", return_value="A test summary."
+        ):
+            call_command("load_courses", "test_courses.json")
+        self.assertTrue(Course.objects.get().source_hash)
+
+        # Edits made outside the catalogue survive a reload of the same file
+        Course.objects.update(courseName="Edited Course")
+        out = StringIO()
+        call_command("load_courses", "test_courses.json", stdout=out)
+        self.assertIn("1 unchanged course(s) skipped", out.getvalue())
+        self.assertEqual(Course.objects.get().courseName, "Edited Course")
+
+        call_command("load_courses", "test_courses.json", "--force")
+        self.assertEqual(Course.objects.get().courseName, "Test Course")
+
+        course_data["description"] = "Updated description"
+        with open("test_courses.json", "w") as f:
+            json.dump({"Computer Science": [course_data]}, f)
+        call_command("load_courses", "test_courses.json")
+        self.assertEqual(Course.objects.get().courseDescription, "Updated description")
+
+    @mock.patch.dict(os.environ, {"GEMINI_API_KEY": "test-key"})
+    def test_reload_retries_missing_summary(self):
+        """Test that an unchanged course without a summary is not skipped"""
+        with open("test_courses.json", "w") as f:
+            json.dump(
+                {
+                    "Computer Science": [
+                        {
+                            "course_name": "Test Course",
+                            "course_acronyms": ["COSC-101"],
+                            "departments": {
+                                "Computer Science": "https://test.edu/dept"
+                            },
+                            "description": "Test course description",
+                        }
+                    ]
+                },
+                f,
+            )
+        with mock.patch.object(Command, "generate_course_summary", return_value=""):
+            call_command("load_courses", "test_courses.json")
+        self.assertEqual(Course.objects.get().summary, "")
+
+        out = StringIO()
+        with mock.patch.object(
+            Command, "generate_course_summary", return_value="A test summary."
+        ) as generate:
+            call_command("load_courses", "test_courses.json", stdout=out)
+        generate.assert_called_once()
+        self.assertNotIn("unchanged course(s) skipped", out.getvalue())
+        self.assertEqual(Course.objects.get().summary, "A test summary.")
+
+        # Once the summary is stored the course is skipped again
+        out = StringIO()
+        call_command("load_courses", "test_courses.json", stdout=out)
+        self.assertIn("1 unchanged course(s) skipped", out.getvalue())
+
+    @mock.patch.dict(os.environ, {"GEMINI_API_KEY": ""})
+    def test_reload_skips_course_without_summary_when_keyless(self):
+        """Test that a missing summary does not force a reload without an API key"""
+        with open("test_courses.json", "w") as f:
+            json.dump(
+                {
+                    "Computer Science": [
+                        {
+                            "course_name": "Test Course",
+                            "course_acronyms": ["COSC-101"],
+                            "departments": {
+                                "Computer Science": "https://test.edu/dept"
+                            },
+                            "description": "Test course description",
+                        }
+                    ]
+                },
+                f,
+            )
+        call_command("load_courses", "test_courses.json")
+        self.assertEqual(Course.objects.get().summary, "")
+
+        out = StringIO()
+        call_command("load_courses", "test_courses.json", stdout=out)
+        self.assertIn("1 unchanged course(s) skipped", out.getvalue())
+
+    def test_corequisites_follow_load_order(self):
+        """Test that corequisite links are mirrored and later records win"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Lecture",
+                    "course_acronyms": ["COSC-101"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "corequisites": [4130102, 4130103],
+                },
+                {
+                    "course_name": "Lab",
+                    "course_acronyms": ["COSC-102"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "corequisites": [],
+                },
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json")
+
+        lecture = Course.objects.get(id=4130101)
+        self.assertEqual(
+            list(lecture.corequisites.values_list("id", flat=True)), [4130103]
+        )
+        self.assertEqual(
+            list(
+                Course.objects.get(id=4130103).corequisites.values_list("id", flat=True)
+            ),
+            [4130101],
+        )
+        self.assertFalse(Course.objects.get(id=4130102).corequisites.exists())
+
+    def test_stream_matches_full_load(self):
+        """Test that --stream loads the same courses as a regular load"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Test Course",
+                    "course_acronyms": ["COSC-101"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "offerings": {"Fall 2024": "https://test.edu/fall2024"},
+                }
+            ],
+            "Mathematics": [
+                {
+                    "course_name": "Calculus",
+                    "course_acronyms": ["MATH-111"],
+                    "departments": {"Mathematics": "https://test.edu/math"},
+                    "description": "Test course description",
+                }
+            ],
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json", "--stream")
+
+        self.assertEqual(
+            sorted(Course.objects.values_list("courseName", flat=True)),
+            ["Calculus", "Test Course"],
+        )
+        self.assertEqual(
+            Course.objects.get(courseName="Test Course").fallOfferings.count(), 1
+        )
+
+    def test_load_ndjson_catalogue(self):
+        """Test that an NDJSON catalogue loads like the equivalent JSON file"""
+        records = [
+            {
+                "dept": "Computer Science",
+                "course_name": "Test Course",
+                "course_acronyms": ["COSC-101"],
+                "departments": {"Computer Science": "https://test.edu/dept"},
+                "description": "Test course description",
+                "offerings": {"Fall 2024": "https://test.edu/fall2024"},
+            },
+            {
+                "dept": "Mathematics",
+                "course_name": "Calculus",
+                "course_acronyms": ["MATH-111"],
+                "departments": {"Mathematics": "https://test.edu/math"},
+                "description": "Test course description",
+            },
+        ]
+
+        with open("test_courses.ndjson", "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+        call_command("load_courses", "test_courses.ndjson")
+
+        self.assertEqual(
+            sorted(Course.objects.values_list("courseName", flat=True)),
+            ["Calculus", "Test Course"],
+        )
+        self.assertEqual(
+            Course.objects.get(courseName="Test Course").fallOfferings.count(), 1
+        )
+
+    def test_ndjson_record_without_dept_is_rejected(self):
+        """Test that an NDJSON line without a dept field is reported, not raised"""
+        records = [
+            {
+                "course_name": "No Department",
+                "course_acronyms": ["COSC-102"],
+                "departments": {"Computer Science": "https://test.edu/dept"},
+                "description": "Test course description",
+            },
+            {
+                "dept": "Computer Science",
+                "course_name": "Test Course",
+                "course_acronyms": ["COSC-101"],
+                "departments": {"Computer Science": "https://test.edu/dept"},
+                "description": "Test course description",
+            },
+        ]
+        with open("test_courses.ndjson", "w") as f:
+            for record in records:
+                f.write(json.dumps(record) + "\n")
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("load_courses", "test_courses.ndjson", stdout=out)
+        self.assertIn("Missing required field 'dept'", out.getvalue())
+        self.assertIn("1 course record(s) that failed to load", out.getvalue())
+        self.assertEqual(Course.objects.get().courseName, "Test Course")
+
+        out = StringIO()
+        call_command(
+            "load_courses", "test_courses.ndjson", "--skip-bad-records", stdout=out
+        )
+        self.assertIn("Skipping malformed course record", out.getvalue())
+        self.assertEqual(Course.objects.count(), 1)
+
+    def test_record_without_sections_keeps_existing_section(self):
+        """Test that a record without sections leaves a course's real sections alone"""
+        section_course = {
+            "course_name": "Test Course",
+            "course_acronyms": ["COSC-101"],
+            "departments": {"Computer Science": "https://test.edu/dept"},
+            "description": "Test course description",
+            "section_information": {
+                "01": {
+                    "professor_name": "Dr. Test",
+                    "professor_link": "https://test.edu/prof",
+                    "course_location": "SCCE A011",
+                    "mon_start_time": "09:00 AM",
+                }
+            },
+        }
+        test_data = {
+            "Computer Science": [
+                section_course,
+                {**section_course, "section_information": {}},
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json")
+
+        section = Section.objects.get()
+        self.assertEqual(section.professor.name, "Dr. Test")
+        self.assertEqual(section.location, "SCCE A011")
+        self.assertEqual(section.monday_start_time, time(9, 0))
+        self.assertEqual(
+            list(Course.objects.get().professors.values_list("name", flat=True)),
+            ["Dr. Test"],
+        )
+
+        # Sections stored by an earlier load are kept too
+        with open("test_courses.json", "w") as f:
+            json.dump(
+                {
+                    "Computer Science": [
+                        {
+                            **section_course,
+                            "description": "Updated description",
+                            "section_information": {},
+                        }
+                    ]
+                },
+                f,
+            )
+
+        call_command("load_courses", "test_courses.json")
+
+        section = Section.objects.get()
+        self.assertEqual(section.professor.name, "Dr. Test")
+        self.assertEqual(section.location, "SCCE A011")
+        course = Course.objects.get()
+        self.assertEqual(course.courseDescription, "Updated description")
+        self.assertEqual(
+            list(course.professors.values_list("name", flat=True)), ["Dr. Test"]
+        )
+
+    def test_bad_record_only_rolls_back_its_course(self):
+        """Test that a failing record does not abort the rest of the load"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Broken Course",
+                    "course_acronyms": ["COSC-101"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                },
+                {
+                    "course_name": "Test Course",
+                    "course_acronyms": ["COSC-102"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                },
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("load_courses", "test_courses.json", stdout=out)
+
+        self.assertEqual(
+            list(Course.objects.values_list("courseName", flat=True)),
+            ["Test Course"],
+        )
+        self.assertFalse(Section.objects.filter(section_for_id=4130101).exists())
+        self.assertIn("1 course record(s) that failed to load", out.getvalue())
+
+    def test_workers_prepare_records_in_processes(self):
+        """Test that --workers loads the same courses and sections as one process"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Test Course",
+                    "course_acronyms": ["COSC-101"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "section_information": {
+                        "01": {
+                            "professor_name": "Dr. Test",
+                            "professor_link": "https://test.edu/prof",
+                            "mon_start_time": "09:00 AM",
+                            "mon_end_time": "10:15 AM",
+                        }
+                    },
+                }
+            ],
+            "Mathematics": [
+                {
+                    "course_name": "Calculus",
+                    "course_acronyms": ["MATH-111"],
+                    "departments": {"Mathematics": "https://test.edu/math"},
+                    "description": "Test course description",
+                }
+            ],
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json", "--workers", "2")
+
+        self.assertEqual(
+            sorted(Course.objects.values_list("courseName", flat=True)),
+            ["Calculus", "Test Course"],
+        )
+        section = Section.objects.get(section_for__courseName="Test Course")
+        self.assertEqual(section.professor.name, "Dr. Test")
+        self.assertEqual(section.monday_start_time, time(9, 0))
+
+    def test_reload_does_not_duplicate_prerequisite_sets(self):
+        """Test that loading the same prerequisites twice stores each group once"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Data Structures",
+                    "course_acronyms": ["COSC-211"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "prerequisites": {
+                        "required": [[4130111], [4130112, 4130113], [4130111]],
+                    },
+                }
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        call_command("load_courses", "test_courses.json")
+        call_command("load_courses", "test_courses.json")
+
+        course = Course.objects.get(id=4130211)
+        self.assertEqual(course.required_courses.count(), 2)
+
+    def test_unknown_offering_term_reported_once(self):
+        """Test that an unknown term is skipped and reported a single time"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": f"Test Course {number}",
+                    "course_acronyms": [f"COSC-{number}"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "offerings": {
+                        "Summer 2024": "https://test.edu/summer2024",
+                        "January 2025": "https://test.edu/jan2025",
+                    },
+                }
+                for number in (101, 102)
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        out = StringIO()
+        call_command("load_courses", "test_courses.json", stdout=out)
+
+        self.assertEqual(out.getvalue().count("Summer is not a valid term"), 1)
+        for course in Course.objects.all():
+            self.assertEqual(course.janOfferings.count(), 1)
+
+    def test_parse_ampm_time(self):
+        """Test that meeting times parse the same as strptime('%I:%M %p')"""
+        self.assertEqual(Command.parse_ampm_time("9:00 AM"), time(9, 0))
+        self.assertEqual(Command.parse_ampm_time("12:15 PM"), time(12, 15))
+        self.assertEqual(Command.parse_ampm_time("12:30 am"), time(0, 30))
+        self.assertEqual(Command.parse_ampm_time("02:50 PM"), time(14, 50))
+        self.assertIsNone(Command.parse_ampm_time("13:00 PM"))
+        self.assertIsNone(Command.parse_ampm_time("null"))
+        self.assertIsNone(Command.parse_ampm_time(None))
+
+    def test_per_course_output_needs_verbosity_2(self):
+        """Test that per-course success lines are only written at --verbosity 2"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": "Test Course",
+                    "course_acronyms": ["COSC-101"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                }
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        out = StringIO()
+        call_command("load_courses", "test_courses.json", "--force", stdout=out)
+        self.assertNotIn("Successfully created course", out.getvalue())
+        self.assertIn("Loaded 1 course record(s).", out.getvalue())
+
+        out = StringIO()
+        call_command(
+            "load_courses", "test_courses.json", "--force", verbosity=2, stdout=out
+        )
+        self.assertIn('Successfully created course "Test Course"', out.getvalue())
+
+    def test_batch_size_commits_courses_in_batches(self):
+        """Test that --batch-size 1 loads every course and its relations"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_name": f"Course {number}",
+                    "course_acronyms": [f"COSC-{number}"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                    "corequisites": [4130102] if number == 101 else [],
+                }
+                for number in (101, 102, 103)
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        out = StringIO()
+        call_command(
+            "load_courses", "test_courses.json", "--batch-size", "1", stdout=out
+        )
+
+        self.assertEqual(
+            Course.objects.filter(courseName__startswith="Course").count(), 3
+        )
+        self.assertEqual(Section.objects.count(), 3)
+        self.assertIn("Loaded 3 course record(s).", out.getvalue())
+
+    def test_invalid_record_creates_no_lookup_rows(self):
+        """Test that records missing required fields are rejected before lookups"""
+        test_data = {
+            "Computer Science": [
+                {
+                    "course_acronyms": ["COSC-101"],
+                    "departments": {"Computer Science": "https://test.edu/dept"},
+                    "description": "Test course description",
+                }
+            ]
+        }
+
+        with open("test_courses.json", "w") as f:
+            json.dump(test_data, f)
+
+        out = StringIO()
+        with self.assertRaises(CommandError):
+            call_command("load_courses", "test_courses.json", stdout=out)
+
+        self.assertIn("Missing required field 'course_name'", out.getvalue())
+        self.assertFalse(CourseCode.objects.exists())
+        self.assertFalse(Course.objects.exists())
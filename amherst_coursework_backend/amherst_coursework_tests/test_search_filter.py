@@ -82,6 +82,26 @@ class TestComputeSimilarityScores(TestCase):
         # First item should have highest similarity
         self.assertEqual(max(scores), scores[0])
 
+    def test_matches_tfidf_fit_on_query_and_information(self):
+        """Scores equal a TF-IDF fit over the query plus the information"""
+        from sklearn.feature_extraction.text import TfidfVectorizer
+        from sklearn.metrics.pairwise import cosine_similarity
+
+        query = "intro computer science quantum"
+        information = [
+            "Intro to Computer Science",
+            "computer programming and computer systems",
+            "the and of",
+            "Quantum mechanics for science majors",
+        ]
+        tfidf = TfidfVectorizer(stop_words="english").fit_transform(
+            [query] + information
+        )
+        expected = cosine_similarity(tfidf[0:1], tfidf[1:])[0]
+        scores = compute_similarity_scores(query, information)
+        for score, expected_score in zip(scores, expected):
+            self.assertAlmostEqual(score, expected_score)
+
 
 class TestFilter(TestCase):
     @classmethod